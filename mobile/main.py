@@ -65,6 +65,7 @@ from momentum.assessments import (
     RESULTS_GUIDE,
     STROOP_INSTRUCTIONS,
     StroopResult,
+    bdefs_domain_max_score,
     bisbas_bespoke_guidance,
     bisbas_domain_advice,
     bisbas_effective_domain_max_score,
@@ -2720,8 +2721,7 @@ class BdefsScreen(Screen):
 
         msg = f"Total: {saved.score}/{saved.max_score}\n\n"
         for d, s in saved.domain_scores.items():
-            n_qs = len(BDEFS_QUESTIONS[d])
-            msg += f"{d}: {s}/{n_qs * 4}\n"
+            msg += f"{d}: {s}/{bdefs_domain_max_score(d)}\n"
         msg += f"\n{interpret_bdefs(saved.score, saved.max_score)}"
 
         scroll = ScrollView(do_scroll_x=False)
@@ -2734,8 +2734,7 @@ class BdefsScreen(Screen):
             "Domain Advice", font_size=sp(15), bold=True, color=_ACCENT,
         ))
         for d, s in saved.domain_scores.items():
-            n_qs = len(BDEFS_QUESTIONS[d])
-            advice = domain_advice(d, s, n_qs * 4)
+            advice = domain_advice(d, s, bdefs_domain_max_score(d))
             inner.add_widget(_make_label(d, font_size=sp(13), bold=True, color=_ACCENT))
             inner.add_widget(_make_label(advice, font_size=sp(11), color=_MUTED))
         scroll.add_widget(inner)
@@ -3180,8 +3179,7 @@ class ResultsScreen(ScrollScreen):
 
             if r.assessment_type == AssessmentType.BDEFS:
                 for d, s in r.domain_scores.items():
-                    n_qs = len(BDEFS_QUESTIONS.get(d, []))
-                    max_d = n_qs * 4 if n_qs else 1
+                    max_d = bdefs_domain_max_score(d) or 1
                     c.add_widget(_make_label(f"  {d}: {s}", font_size=sp(12), color=_MUTED))
                     advice = domain_advice(d, s, max_d)
                     c.add_widget(_make_label(
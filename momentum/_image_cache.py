@@ -0,0 +1,93 @@
+"""On-disk cache for the GUI banner photos.
+
+Banners are fetched from Unsplash once per ``(photo_id, size)`` and stored as
+PNG under :func:`momentum.config.get_cache_dir`, so later launches skip the
+HTTP round-trip and JPEG decode entirely.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import urllib.request
+from pathlib import Path
+
+from PIL import Image
+
+from momentum import config as cfg
+
+log = logging.getLogger(__name__)
+
+_MAX_ENTRIES: int = 32
+_FETCH_TIMEOUT_S: float = 5
+
+
+def _cache_path(photo_id: str, w: int, h: int) -> Path:
+    return cfg.get_cache_dir() / f"{photo_id}_{w}x{h}.png"
+
+
+def _download(photo_id: str, w: int, h: int) -> bytes:
+    """Fetch the photo from Unsplash, cropped and resized server-side."""
+    url = (
+        f"https://images.unsplash.com/{photo_id}?w={w}&h={h}&fit=crop&auto=format&q=75"
+    )
+    req = urllib.request.Request(url, headers={"User-Agent": "Momentum/0.1"})
+    with urllib.request.urlopen(req, timeout=_FETCH_TIMEOUT_S) as resp:
+        data: bytes = resp.read()
+    return data
+
+
+def _evict(cache_dir: Path, keep: int = _MAX_ENTRIES) -> None:
+    """Delete all but the *keep* most recently used banners."""
+    entries = sorted(
+        cache_dir.glob("photo-*.png"),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    for stale in entries[keep:]:
+        stale.unlink(missing_ok=True)
+
+
+def cached_photo_ids(w: int, h: int) -> list[str]:
+    """Return the ids of every banner already cached at ``w``x``h``."""
+    suffix = f"_{w}x{h}.png"
+    return [
+        p.name.removesuffix(suffix)
+        for p in cfg.get_cache_dir().glob(f"photo-*{suffix}")
+    ]
+
+
+def get_banner(photo_id: str, w: int, h: int) -> bytes:
+    """Return PNG bytes for *photo_id* at ``w``x``h``, downloading on a miss.
+
+    Network errors propagate so the caller can try another photo.
+    """
+    path = _cache_path(photo_id, w, h)
+    try:
+        data = path.read_bytes()
+        path.touch()  # refresh mtime so eviction is least-recently-used
+        return data
+    except OSError:
+        pass
+
+    source = Image.open(io.BytesIO(_download(photo_id, w, h)))
+    # For JPEG, let the decoder scale down by DCT while decoding (a no-op
+    # when the server already sent the requested size).
+    source.draft("RGB", (w, h))
+    image = source.convert("RGB")
+    # The server already crops to size; this only guards against oversize
+    # replies and does nothing when the image already fits.
+    image.thumbnail((w, h), Image.Resampling.BILINEAR)
+    buf = io.BytesIO()
+    image.save(buf, "PNG", optimize=True)
+    data = buf.getvalue()
+
+    try:
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        _evict(path.parent)
+    except OSError:
+        log.debug("Could not write banner cache entry %s.", path, exc_info=True)
+    return data
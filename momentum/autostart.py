@@ -87,11 +87,8 @@ def enable_autostart() -> AutostartStatus:
     # Systemd
     try:
         svc_path = _write_systemd_service(bin_path)
-        subprocess.run(
-            ["systemctl", "--user", "daemon-reload"],
-            check=True,
-            capture_output=True,
-        )
+        # `enable` reads the unit file from disk and reloads the manager
+        # itself afterwards, so no separate daemon-reload is needed.
         subprocess.run(
             ["systemctl", "--user", "enable", _SERVICE_NAME],
             check=True,
@@ -380,6 +380,7 @@ def run_test(
         BISBAS_QUESTIONS,
         BISBAS_SCALE_LABELS,
         StroopResult,
+        bdefs_domain_max_score,
         bisbas_domain_advice,
         bisbas_effective_domain_max_score,
         bisbas_effective_max_score,
@@ -541,9 +542,9 @@ def run_test(
         saved = assessments.save_result(create_model)
         display.print_info(f"\nTotal score: {saved.score}/{saved.max_score}")
         for d, s in saved.domain_scores.items():
-            n_qs = len(BDEFS_QUESTIONS[d])
-            display.print_info(f"  {d}: {s}/{n_qs * 4}")
-            advice = domain_advice(d, s, n_qs * 4)
+            domain_max = bdefs_domain_max_score(d)
+            display.print_info(f"  {d}: {s}/{domain_max}")
+            advice = domain_advice(d, s, domain_max)
             if advice:
                 display.console.print(f"    [dim italic]{advice}[/dim italic]")
         display.print_nudge(interpret_bdefs(saved.score, saved.max_score))
@@ -64,6 +64,7 @@ if _is_android():
     _DATA_DIR = _android_data_dir() / "data"
     _CONFIG_DIR = _DATA_DIR / "config"
     _DB_DIR = _DATA_DIR / "db"
+    _CACHE_DIR = _DATA_DIR / "cache"
     _LEGACY_CONFIG_FILES = [
         legacy_dir / "config" / "config.json"
         for legacy_dir in _android_legacy_data_dirs()
@@ -74,6 +75,7 @@ if _is_android():
 else:
     _CONFIG_DIR = Path.home() / ".config" / "momentum"
     _DB_DIR = Path.home() / ".local" / "share" / "momentum"
+    _CACHE_DIR = Path.home() / ".cache" / "momentum"
     _LEGACY_CONFIG_FILES = []
     _LEGACY_DB_FILES = []
 
@@ -217,6 +219,17 @@ def get_db_path() -> Path:
     return default_path
 
 
+def is_in_data_dir(path: Path) -> bool:
+    """Return True if *path* lives in the app's own (unsynced) data directory."""
+    return path.expanduser().resolve().is_relative_to(_DB_DIR.expanduser().resolve())
+
+
+def get_cache_dir() -> Path:
+    """Return the directory for disposable cached artefacts (created on demand)."""
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    return _CACHE_DIR
+
+
 def set_db_path(path: str) -> AppConfig:
     """Set a custom database path and save config."""
     resolved = Path(path).expanduser().resolve()
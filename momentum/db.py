@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Optional
 
 from momentum.config import get_db_path as _config_get_db_path
+from momentum.config import is_in_data_dir
 from momentum.models import (
     ActJournalEntry,
     ActJournalEntryCreate,
@@ -72,12 +73,55 @@ def _get_db_path() -> Path:
     return _config_get_db_path()
 
 
-def get_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
-    """Open a connection and ensure the schema exists."""
-    path = db_path or _get_db_path()
-    conn = sqlite3.connect(str(path))
+# Per-connection tuning for a small, read-heavy local database.
+_PRAGMAS = """
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -20000;
+PRAGMA mmap_size = 268435456;
+PRAGMA foreign_keys = ON;
+"""
+
+# WAL lets reads proceed during writes, but committed pages sit in the -wal
+# and -shm sidecar files for as long as any connection is open (the GUI keeps
+# one for the whole session). Sync clients upload those separately from the
+# .db, so WAL is only used inside the app's own data directory. Any other
+# file (custom or cloud-sync paths) gets an explicit rollback journal, which
+# also converts a file left in WAL mode by an older version back.
+_LOCAL_JOURNAL_PRAGMAS = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+"""
+_SHARED_JOURNAL_PRAGMAS = """
+PRAGMA journal_mode = DELETE;
+PRAGMA synchronous = FULL;
+"""
+
+
+# sqlite3 keeps prepared statements per connection keyed by SQL text, so the
+# module-level query constants below are compiled once per connection. Size
+# the cache so every query in this module stays resident.
+_STATEMENT_CACHE_SIZE = 256
+
+
+def get_connection(db_path: Optional[Path | str] = None) -> sqlite3.Connection:
+    """Open a connection and ensure the schema exists.
+
+    ``file:`` URIs are passed through to SQLite as URIs, which lets tests use
+    shared-cache in-memory databases (``file:name?mode=memory&cache=shared``).
+    """
+    target = str(db_path or _get_db_path())
+    conn = sqlite3.connect(
+        target,
+        cached_statements=_STATEMENT_CACHE_SIZE,
+        uri=target.startswith("file:"),
+    )
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(_PRAGMAS)
+    if target != ":memory:" and not target.startswith("file:"):
+        if is_in_data_dir(Path(target)):
+            conn.executescript(_LOCAL_JOURNAL_PRAGMAS)
+        else:
+            conn.executescript(_SHARED_JOURNAL_PRAGMAS)
     conn.executescript(_SCHEMA)
     return conn
 
@@ -138,6 +182,20 @@ def list_tasks(
     return [_row_to_task(r) for r in rows]
 
 
+_ALL_TASKS_ORDER = (
+    " ORDER BY CASE status WHEN 'active' THEN 0 WHEN 'pending' THEN 1 ELSE 2 END,"
+    " created_at ASC, id ASC"
+)
+_ALL_TASKS_SQL = "SELECT * FROM tasks" + _ALL_TASKS_ORDER
+_OPEN_TASKS_SQL = "SELECT * FROM tasks WHERE status != 'done'" + _ALL_TASKS_ORDER
+
+
+def list_all_tasks(conn: sqlite3.Connection, include_done: bool = True) -> list[Task]:
+    """List tasks in display order (active, pending, done) with one query."""
+    rows = conn.execute(_ALL_TASKS_SQL if include_done else _OPEN_TASKS_SQL).fetchall()
+    return [_row_to_task(r) for r in rows]
+
+
 def complete_task(conn: sqlite3.Connection, task_id: int) -> Optional[Task]:
     """Mark a task as done and update the daily log."""
     now = datetime.now()
@@ -240,31 +298,6 @@ def get_daily_log(conn: sqlite3.Connection, for_date: date) -> DailyLog:
     return DailyLog(date=for_date, tasks_completed=0, focus_minutes=0)
 
 
-def _calculate_streak(conn: sqlite3.Connection) -> int:
-    """Count consecutive days (ending today or yesterday) with at least one task completed."""
-    rows = conn.execute(
-        "SELECT date FROM daily_log WHERE tasks_completed > 0 ORDER BY date DESC"
-    ).fetchall()
-    if not rows:
-        return 0
-
-    streak = 0
-    check_date = date.today()
-    dates = {date.fromisoformat(r["date"]) for r in rows}
-
-    # Allow streak to start from today or yesterday
-    if check_date not in dates:
-        check_date -= timedelta(days=1)
-        if check_date not in dates:
-            return 0
-
-    while check_date in dates:
-        streak += 1
-        check_date -= timedelta(days=1)
-
-    return streak
-
-
 # ---------------------------------------------------------------------------
 # Assessments
 # ---------------------------------------------------------------------------
@@ -454,29 +487,54 @@ def delete_daily_log(conn: sqlite3.Connection, log_date: str) -> bool:
     return cur.rowcount > 0
 
 
+# Today's log, week totals and the completion streak in one statement. The
+# streak walks back one day at a time from today (or yesterday, if nothing has
+# been completed yet today) while each earlier day has completions.
+_STATUS_SQL = """
+WITH RECURSIVE
+    done_days(d) AS (
+        SELECT date FROM daily_log WHERE tasks_completed > 0
+    ),
+    streak(d) AS (
+        SELECT CASE
+            WHEN :today IN (SELECT d FROM done_days) THEN :today
+            ELSE date(:today, '-1 day')
+        END
+        WHERE :today IN (SELECT d FROM done_days)
+            OR date(:today, '-1 day') IN (SELECT d FROM done_days)
+        UNION ALL
+        SELECT date(d, '-1 day') FROM streak
+        WHERE date(d, '-1 day') IN (SELECT d FROM done_days)
+    )
+SELECT
+    COALESCE((SELECT tasks_completed FROM daily_log WHERE date = :today), 0) AS today_tc,
+    COALESCE((SELECT focus_minutes FROM daily_log WHERE date = :today), 0) AS today_fm,
+    (SELECT COALESCE(SUM(tasks_completed), 0) FROM daily_log WHERE date >= :week_start) AS week_tc,
+    (SELECT COALESCE(SUM(focus_minutes), 0) FROM daily_log WHERE date >= :week_start) AS week_fm,
+    (SELECT COUNT(*) FROM streak) AS streak
+"""
+
+
 def get_status(conn: sqlite3.Connection) -> StatusSummary:
     """Build the full status summary."""
-    today_log = get_daily_log(conn, date.today())
-
-    # Week totals
-    week_start = date.today() - timedelta(days=date.today().weekday())
-    rows = conn.execute(
-        "SELECT COALESCE(SUM(tasks_completed), 0) as tc, COALESCE(SUM(focus_minutes), 0) as fm "
-        "FROM daily_log WHERE date >= ?",
-        (week_start.isoformat(),),
+    today = date.today()
+    week_start = today - timedelta(days=today.weekday())
+    row = conn.execute(
+        _STATUS_SQL,
+        {"today": today.isoformat(), "week_start": week_start.isoformat()},
     ).fetchone()
-    week_tasks = rows["tc"] if rows else 0
-    week_focus = rows["fm"] if rows else 0
 
-    pending = list_tasks(conn, status=TaskStatus.PENDING)
-    active = list_tasks(conn, status=TaskStatus.ACTIVE)
-    streak = _calculate_streak(conn)
+    open_tasks = list_all_tasks(conn, include_done=False)
 
     return StatusSummary(
-        today=today_log,
-        week_tasks_completed=week_tasks,
-        week_focus_minutes=week_focus,
-        streak_days=streak,
-        pending_tasks=pending,
-        active_tasks=active,
+        today=DailyLog(
+            date=today,
+            tasks_completed=row["today_tc"],
+            focus_minutes=row["today_fm"],
+        ),
+        week_tasks_completed=row["week_tc"],
+        week_focus_minutes=row["week_fm"],
+        streak_days=row["streak"],
+        pending_tasks=[t for t in open_tasks if t.status == TaskStatus.PENDING],
+        active_tasks=[t for t in open_tasks if t.status == TaskStatus.ACTIVE],
     )
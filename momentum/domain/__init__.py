@@ -25,6 +25,7 @@ from momentum.domain.assessments import (
     PersonalisationProfile,
     StroopResult,
     StroopTrial,
+    bdefs_domain_max_score,
     bdefs_max_score,
     bisbas_bespoke_guidance,
     bisbas_domain_advice,
@@ -55,6 +56,7 @@ from momentum.domain.timer import (
     TimerOutcome,
     TimerService,
     TimerSession,
+    TimerStopped,
     default_timer_service,
     run_break,
     run_focus,
@@ -82,6 +84,7 @@ __all__ = [
     "RESULTS_GUIDE",
     # Scoring functions
     "bdefs_max_score",
+    "bdefs_domain_max_score",
     "bisbas_max_score",
     "bisbas_total_min_score",
     "bisbas_effective_max_score",
@@ -98,6 +101,7 @@ __all__ = [
     "RichTimerProgress",
     "ConsoleEncouragement",
     "TimerService",
+    "TimerStopped",
     "default_timer_service",
     "run_timer",
     "run_focus",
@@ -44,6 +44,7 @@ from momentum.domain.assessments.scoring import (
     STROOP_DEFAULT_TRIALS,
     StroopResult,
     StroopTrial,
+    bdefs_domain_max_score,
     bdefs_max_score,
     bisbas_effective_domain_max_score,
     bisbas_effective_max_score,
@@ -65,6 +66,7 @@ __all__ = [
     "BDEFS_MIN_PER_ITEM",
     "BDEFS_MAX_PER_ITEM",
     "bdefs_max_score",
+    "bdefs_domain_max_score",
     "score_bdefs",
     "BISBAS_SCALE",
     "BISBAS_SCALE_LABELS",
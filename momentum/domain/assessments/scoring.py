@@ -19,6 +19,17 @@ try:
 except ImportError:
     pass
 
+
+def _sum_domains(answers: dict[str, list[int]]) -> tuple[dict[str, int], int]:
+    """Sum each domain's responses and the grand total.
+
+    The built-in ``sum`` reduces each domain in C; the total then folds the
+    handful of domain sums rather than re-walking every response.
+    """
+    domain_scores = {domain: sum(scores) for domain, scores in answers.items()}
+    return domain_scores, sum(domain_scores.values())
+
+
 # ---------------------------------------------------------------------------
 # BDEFS-style self-report
 # ---------------------------------------------------------------------------
@@ -58,10 +69,20 @@ BDEFS_MIN_PER_ITEM = 1
 BDEFS_MAX_PER_ITEM = 4
 
 
+# The questionnaire is fixed, so its sizes are computed once at import.
+_BDEFS_DOMAIN_LENS: dict[str, int] = {d: len(qs) for d, qs in BDEFS_QUESTIONS.items()}
+_BDEFS_TOTAL_ITEMS: int = sum(_BDEFS_DOMAIN_LENS.values())
+_BDEFS_MAX_SCORE: int = _BDEFS_TOTAL_ITEMS * BDEFS_MAX_PER_ITEM
+
+
 def bdefs_max_score() -> int:
     """Maximum possible BDEFS total score."""
-    n_items = sum(len(qs) for qs in BDEFS_QUESTIONS.values())
-    return n_items * BDEFS_MAX_PER_ITEM
+    return _BDEFS_MAX_SCORE
+
+
+def bdefs_domain_max_score(domain: str) -> int:
+    """Maximum possible raw score for a BDEFS domain."""
+    return _BDEFS_DOMAIN_LENS.get(domain, 0) * BDEFS_MAX_PER_ITEM
 
 
 def score_bdefs(answers: dict[str, list[int]]) -> AssessmentResultCreate:
@@ -81,13 +102,7 @@ def score_bdefs(answers: dict[str, list[int]]) -> AssessmentResultCreate:
         return score_bdefs_cy(answers)
 
     # Pure Python fallback
-    domain_scores: dict[str, int] = {}
-    total = 0
-    for domain, scores in answers.items():
-        ds = sum(scores)
-        domain_scores[domain] = ds
-        total += ds
-
+    domain_scores, total = _sum_domains(answers)
     return AssessmentResultCreate(
         assessment_type=AssessmentType.BDEFS,
         score=total,
@@ -188,12 +203,7 @@ def score_bisbas(answers: dict[str, list[int]]) -> AssessmentResultCreate:
         return score_bisbas_cy(answers)
 
     # Pure Python fallback
-    domain_scores: dict[str, int] = {}
-    total = 0
-    for domain, scores in answers.items():
-        ds = sum(scores)
-        domain_scores[domain] = ds
-        total += ds
+    domain_scores, total = _sum_domains(answers)
     return AssessmentResultCreate(
         assessment_type=AssessmentType.BISBAS,
         score=total,
@@ -241,11 +251,16 @@ class StroopResult:
 
 def generate_stroop_trials(n: int = STROOP_DEFAULT_TRIALS) -> list[StroopTrial]:
     """Generate *n* Stroop trials with mismatched word/colour pairs."""
+    # Offsetting the ink index by 1..k-1 (mod k) guarantees a mismatch with
+    # a uniform ink choice, without building a filtered list per trial.
+    k = len(STROOP_COLOURS)
     trials: list[StroopTrial] = []
     for _ in range(n):
-        word = random.choice(STROOP_COLOURS)
-        ink = random.choice([c for c in STROOP_COLOURS if c != word])
-        trials.append(StroopTrial(word=word, ink_colour=ink))
+        w = random.randrange(k)
+        ink = (w + random.randrange(1, k)) % k
+        trials.append(
+            StroopTrial(word=STROOP_COLOURS[w], ink_colour=STROOP_COLOURS[ink])
+        )
     return trials
 
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from dataclasses import dataclass
 from enum import Enum
@@ -74,11 +75,36 @@ class EncouragementPort(Protocol):
         ...
 
 
+class TimerStopped(Exception):
+    """Raised by a clock whose stop event was set during a session."""
+
+
 class SystemClock:
-    """Production clock implementation backed by time.sleep."""
+    """Production clock implementation backed by time.sleep.
+
+    Each tick sleeps until the next whole second on a ``time.monotonic()``
+    schedule rather than a flat ``sleep(1)``, so the time spent rendering
+    progress between ticks does not accumulate as drift over a long session.
+
+    With a *stop_event*, ticks wait on the event instead, so setting it from
+    another thread ends the session at once with :class:`TimerStopped`.
+    """
+
+    def __init__(self, stop_event: threading.Event | None = None) -> None:
+        self._next_tick: float | None = None
+        self._stop_event = stop_event
 
     def sleep_one_second(self) -> None:
-        time.sleep(1)
+        now = time.monotonic()
+        if self._next_tick is None or now - self._next_tick > 1:
+            # First tick, or resumed after a stall: restart the schedule.
+            self._next_tick = now
+        self._next_tick += 1
+        delay = max(0.0, self._next_tick - now)
+        if self._stop_event is None:
+            time.sleep(delay)
+        elif self._stop_event.wait(delay):
+            raise TimerStopped()
 
 
 class RichTimerProgress:
@@ -189,7 +215,7 @@ class TimerService:
                 self._clock.sleep_one_second()
                 elapsed_seconds += 1
                 self._progress.advance(1)
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, TimerStopped):
             self._progress.interrupted(
                 elapsed_seconds=elapsed_seconds,
                 total_seconds=total_seconds,
@@ -247,10 +273,12 @@ class TimerService:
         )
 
 
-def default_timer_service() -> TimerService:
-    """Build the production timer service."""
+def default_timer_service(
+    stop_event: threading.Event | None = None,
+) -> TimerService:
+    """Build the production timer service, optionally stoppable via *stop_event*."""
     return TimerService(
-        clock=SystemClock(),
+        clock=SystemClock(stop_event),
         progress=RichTimerProgress(),
         encouragement=ConsoleEncouragement(),
     )
@@ -266,9 +294,13 @@ def _session_from_config(config: TimerConfig) -> TimerSession:
     )
 
 
-def run_timer(config: TimerConfig) -> bool:
-    """Run a countdown timer. Returns True if completed, False if interrupted."""
-    return default_timer_service().run(_session_from_config(config)).completed
+def run_timer(config: TimerConfig, stop_event: threading.Event | None = None) -> bool:
+    """Run a countdown timer. Returns True if completed, False if interrupted.
+
+    Setting *stop_event* from another thread interrupts the timer promptly.
+    """
+    service = default_timer_service(stop_event)
+    return service.run(_session_from_config(config)).completed
 
 
 def run_focus(minutes: int = 15, task_id: int | None = None) -> bool:
@@ -294,6 +326,7 @@ __all__ = [
     "TimerProgressPort",
     "TimerService",
     "TimerSession",
+    "TimerStopped",
     "default_timer_service",
     "run_break",
     "run_focus",
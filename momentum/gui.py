@@ -2,22 +2,30 @@
 
 from __future__ import annotations
 
+import functools
 import io
+import itertools
+import json
 import logging
+import math
+import queue
 import random
 import re
 import threading
+import time
 import tkinter as tk
-import urllib.request
 import webbrowser
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
 from tkinter import filedialog, messagebox, scrolledtext, simpledialog, ttk
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 from PIL import Image, ImageDraw, ImageFont, ImageTk
 
 from momentum import config as cfg
 from momentum import db
+from momentum._image_cache import cached_photo_ids, get_banner
 from momentum.assessments import (
     BDEFS_INSTRUCTIONS,
     BDEFS_QUESTIONS,
@@ -28,6 +36,7 @@ from momentum.assessments import (
     RESULTS_GUIDE,
     STROOP_INSTRUCTIONS,
     StroopResult,
+    bdefs_domain_max_score,
     bisbas_domain_advice,
     bisbas_effective_domain_max_score,
     bisbas_effective_max_score,
@@ -49,6 +58,7 @@ from momentum.assessments import (
 from momentum.encouragement import get_break_message, get_nudge
 from momentum.models import (
     ActJournalEntryCreate,
+    AppConfig,
     AssessmentResult,
     AssessmentType,
     TaskStatus,
@@ -69,6 +79,12 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Project root holding the bundled markdown documents; resolved once.
+_DOCS_DIR: Path = Path(__file__).resolve().parent.parent
+_IMAGES_PATH: Path = _DOCS_DIR / "IMAGES.md"
+_README_PATH: Path = _DOCS_DIR / "README.md"
+_SCIENCE_PATH: Path = _DOCS_DIR / "SCIENCE.md"
+
 # Small fallback list used when IMAGES.md is missing.
 _FALLBACK_PHOTOS: list[str] = [
     "photo-1506744038136-46273834b3fb",
@@ -81,39 +97,336 @@ _FALLBACK_PHOTOS: list[str] = [
 ]
 
 
+_PHOTO_ID_RE = re.compile(r"^\s*- (photo-\S+)", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=1)
 def _load_photos() -> list[str]:
-    """Parse photo IDs from IMAGES.md, falling back to built-in list."""
-    md_path = Path(__file__).resolve().parent.parent / "IMAGES.md"
+    """Parse photo IDs from IMAGES.md, falling back to built-in list.
+
+    Parsed lazily on first banner fetch rather than at import time.
+    """
+    md_path = _IMAGES_PATH
     if not md_path.exists():
         return _FALLBACK_PHOTOS
-    ids: list[str] = []
-    for line in md_path.read_text(encoding="utf-8").splitlines():
-        stripped = line.strip()
-        if stripped.startswith("- photo-"):
-            photo_id = stripped[2:].strip()
-            if photo_id:
-                ids.append(photo_id)
+    ids = _PHOTO_ID_RE.findall(md_path.read_text(encoding="utf-8"))
     # Deduplicate while preserving order
-    seen: set[str] = set()
-    unique: list[str] = []
-    for pid in ids:
-        if pid not in seen:
-            seen.add(pid)
-            unique.append(pid)
+    unique = list(dict.fromkeys(ids))
     return unique if unique else _FALLBACK_PHOTOS
 
 
-_PEACEFUL_PHOTOS: list[str] = _load_photos()
-
 _IMG_WIDTH: int = 500
 _IMG_HEIGHT: int = 120
 
+_TITLE_TEXT: str = "Momentum"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_title_font() -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """Load the banner title font once; every banner reuses it."""
+    try:
+        return ImageFont.truetype("DejaVuSans-Bold.ttf", 32)
+    except OSError:
+        return ImageFont.load_default(size=32)
+
+
+@functools.lru_cache(maxsize=1)
+def _title_bbox() -> tuple[float, float, float, float]:
+    """Bounding box of the (constant) banner title in the title font."""
+    return _get_title_font().getbbox(_TITLE_TEXT)
+
+
+# Shown by the help window when README.md is not shipped alongside the package.
+_HELP_FALLBACK: str = (
+    "# Momentum\n\n"
+    "A gentle tool for executive dysfunction support.\n\n"
+    "## Commands\n\n"
+    "- **Add task** -- add something you need to do\n"
+    "- **Complete** -- mark a selected task as done\n"
+    "- **Break down** -- split a task into smaller steps\n"
+)
+
+_SCIENCE_FALLBACK: str = "# The Science Behind Momentum\n\nScience document not found."
+
+# Markdown rendering patterns (help/science windows).
+_INLINE_RE = re.compile(r"(\*\*(.+?)\*\*|`([^`]+)`|\[([^\]]+)\]\(([^)]+)\))")
+_TABLE_SEP_RE = re.compile(r"^\|[-\s|:]+\|$")
+_HEADING_TAGS: dict[int, str] = {1: "h1", 2: "h2", 3: "h3"}
+# Bump when _parse_markdown's output format changes to ignore stale caches.
+_MD_CACHE_VERSION: str = "v1"
+
+_PHOTO_CACHE_SIZE: int = 8
+# Banner downloads kept in flight at once; the first success is shown.
+_FETCH_PARALLEL: int = 2
+_CHART_CACHE_SIZE: int = 8
+
+_REFRESH_DEBOUNCE_MS: int = 30
+
+_TASK_ICONS: dict[TaskStatus, str] = {
+    TaskStatus.ACTIVE: "[~]",
+    TaskStatus.PENDING: "[ ]",
+    TaskStatus.DONE: "[x]",
+}
+
+# Bump the suffix whenever _render_app_icon changes so stale caches are ignored.
+_ICON_CACHE_NAME: str = "icon_v2.png"
+
+
+class _TextPeer(tk.Text):
+    """A Text widget sharing another Text's content via ``peer create``.
+
+    tkinter's ``Text.peer_create`` only takes a Tcl path name and returns
+    nothing, and ``nametowidget`` cannot find a widget that Tk created by
+    itself. So the Python wrapper is registered first with
+    ``BaseWidget._setup``, the private step every tkinter widget constructor
+    runs, and Tk then creates the peer at that path. Content, tags and tag
+    bindings all live in the shared B-tree.
+
+    If a tkinter release drops ``_setup``, this falls back to an ordinary
+    empty Text and sets ``is_peer`` to False so the caller can fill it.
+    """
+
+    def __init__(self, source: tk.Text, master: tk.Misc, **kw: object) -> None:
+        setup = getattr(tk.BaseWidget, "_setup", None)
+        self.is_peer = setup is not None
+        if setup is None:
+            super().__init__(master, kw)
+            return
+        setup(self, master, {})
+        source.peer_create(self._w, **kw)
+
+
+def _insert_runs(widget: tk.Text, runs: list[tuple[str, str]]) -> None:
+    """Append ``(chars, tag)`` runs to *widget* in a single Tk call.
+
+    ``Text.insert`` accepts alternating chars/tag arguments, so one Tcl
+    round-trip replaces one per run.
+    """
+    if runs:
+        widget.insert(tk.END, *itertools.chain.from_iterable(runs))
+
+
+def _make_link(url: str) -> Callable[[tk.Event], object]:  # type: ignore[type-arg]
+    return lambda _e: webbrowser.open(url)
+
+
+def _parse_markdown(md: str) -> tuple[list[tuple[str, str]], list[str]]:
+    """Parse *md* into ``(text, tag)`` runs plus the link URLs they reference.
+
+    Consecutive text with the same tag is merged into one run, so applying
+    the result costs one Tk insert per run. Link runs use the tag
+    ``md_link_<n>``, where ``n`` indexes the returned URL list.
+    """
+    segments: list[tuple[str, str]] = []
+    links: list[str] = []
+    pending_text: list[str] = []
+    pending_tag = ""
+
+    def _flush() -> None:
+        if pending_text:
+            segments.append(("".join(pending_text), pending_tag))
+            pending_text.clear()
+
+    def _append(text: str, tag: str = "") -> None:
+        nonlocal pending_tag
+        if tag != pending_tag:
+            _flush()
+            pending_tag = tag
+        pending_text.append(text)
+
+    def _insert_inline(line: str, base_tag: str) -> None:
+        """Append a line handling **bold**, `code`, and [links](url)."""
+        # Most prose lines carry no markup; skip the regex scan for them.
+        if "*" not in line and "`" not in line and "[" not in line:
+            if line:
+                _append(line, base_tag)
+            return
+        pos = 0
+        for m in _INLINE_RE.finditer(line):
+            # Text before this match
+            if m.start() > pos:
+                _append(line[pos : m.start()], base_tag)
+            if m.group(2) is not None:  # **bold**
+                _append(m.group(2), "bold")
+            elif m.group(3) is not None:  # `inline code`
+                _append(m.group(3), "inline_code")
+            elif m.group(4) is not None:  # [text](url)
+                _append(m.group(4), f"md_link_{len(links)}")
+                links.append(m.group(5))
+            pos = m.end()
+        if pos < len(line):
+            _append(line[pos:], base_tag)
+
+    in_code_block = False
+
+    def _handle_fence(line: str) -> bool:
+        nonlocal in_code_block
+        if not line.startswith("```"):
+            return False
+        if in_code_block:
+            _append("\n")
+        in_code_block = not in_code_block
+        return True
+
+    def _handle_heading(line: str) -> bool:
+        level = len(line) - len(line.lstrip("#"))
+        heading_tag = _HEADING_TAGS.get(level)
+        if heading_tag is None or line[level : level + 1] != " ":
+            return False
+        _append(line[level + 1 :] + "\n", heading_tag)
+        return True
+
+    def _handle_table(line: str) -> bool:
+        # Separator rows (|---|---|) are dropped entirely.
+        if _TABLE_SEP_RE.match(line):
+            return True
+        if not line.endswith("|"):
+            return False
+        cells = [c.strip() for c in line.strip("|").split("|")]
+        row = "  ".join(f"{c:<30}" if ci == 0 else c for ci, c in enumerate(cells))
+        _insert_inline(row + "\n", "table_row")
+        return True
+
+    def _handle_bullet(line: str) -> bool:
+        if line[1:2] != " ":
+            return False
+        _insert_inline("  --  " + line[2:] + "\n", "bullet")
+        return True
+
+    # Block handlers keyed by a line's first character; each returns
+    # False to let the line fall through to a plain paragraph.
+    dispatch: dict[str, Callable[[str], bool]] = {
+        "`": _handle_fence,
+        "#": _handle_heading,
+        "|": _handle_table,
+        "-": _handle_bullet,
+        "*": _handle_bullet,
+    }
+
+    for line in md.splitlines():
+        if in_code_block and not line.startswith("```"):
+            _append(line + "\n", "code_block")
+            continue
+        if not line.strip():
+            _append("\n")
+            continue
+        handler = dispatch.get(line[0])
+        if handler is not None and handler(line):
+            continue
+        _insert_inline(line + "\n", "body")
+
+    _flush()
+    return segments, links
+
+
+def _load_markdown_segments(
+    path: Path, fallback: str
+) -> tuple[list[tuple[str, str]], list[str]]:
+    """Parse the markdown file at *path*, reusing an on-disk parse cache.
+
+    The cache entry is keyed by the file's mtime and size, so edits to the
+    document invalidate it. Falls back to parsing *fallback* if *path* is
+    unreadable.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return _parse_markdown(fallback)
+    key = [stat.st_mtime_ns, stat.st_size]
+    cache_path: Path | None
+    try:
+        cache_dir = cfg.get_cache_dir()
+    except OSError:
+        log.debug("No cache directory; parsing %s uncached.", path, exc_info=True)
+        cache_path = None
+    else:
+        cache_path = cache_dir / f"{path.stem.lower()}_{_MD_CACHE_VERSION}.json"
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            if cached["key"] == key:
+                segments = [(text, tag) for text, tag in cached["segments"]]
+                return segments, list(cached["links"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    try:
+        md = path.read_text(encoding="utf-8")
+    except OSError:
+        return _parse_markdown(fallback)
+    segments, links = _parse_markdown(md)
+    if cache_path is None:
+        return segments, links
+    try:
+        cache_path.write_text(
+            json.dumps({"key": key, "segments": segments, "links": links}),
+            encoding="utf-8",
+        )
+    except OSError:
+        log.debug("Could not write markdown cache %s.", cache_path, exc_info=True)
+    return segments, links
+
+
+@dataclass(slots=True)
+class _StroopState:
+    """Progress through one Stroop session in the GUI dialog."""
+
+    idx: int = 0
+    correct: int = 0
+    total_time: float = 0.0
+    t0: float = 0.0
+    # True during the feedback pause, so a repeated Return is ignored.
+    waiting: bool = False
+    per_trial: list[tuple[bool, float]] = field(default_factory=list)
+
+
+def _sync_task_tree(
+    tree: ttk.Treeview,
+    rendered: dict[str, tuple[str, str, str]],
+    new_rows: dict[str, tuple[str, str, str]],
+) -> None:
+    """Update *tree* from *rendered* to *new_rows* with minimal Tk calls.
+
+    Rows map item id to ``(parent id, text, status tag)`` and must list
+    parents before their children.
+    """
+
+    def _sibling_order(
+        rows: dict[str, tuple[str, str, str]],
+    ) -> dict[str, list[str]]:
+        order: dict[str, list[str]] = {}
+        for iid, (parent, _text, _tag) in rows.items():
+            order.setdefault(parent, []).append(iid)
+        return order
+
+    for iid, (parent, text, tag) in new_rows.items():
+        old = rendered.get(iid)
+        if old is None:
+            tree.insert(parent, "end", iid=iid, text=text, tags=(tag,), open=True)
+        elif old[1:] != (text, tag):
+            tree.item(iid, text=text, tags=(tag,))
+
+    # Re-seat children only under parents whose child order changed; this
+    # also lifts subtasks out of parents that are about to be removed.
+    old_order = _sibling_order(rendered)
+    for parent, children in _sibling_order(new_rows).items():
+        if old_order.get(parent) != children:
+            for index, iid in enumerate(children):
+                tree.move(iid, parent, index)
+
+    for iid in rendered.keys() - new_rows.keys():
+        if tree.exists(iid):
+            tree.delete(iid)
+
 
 class MomentumApp:
     """Main GUI application window."""
 
     FOCUS_DEFAULT_MINUTES: int = 15
     BREAK_DEFAULT_MINUTES: int = 5
+    # (SCIENCE.md mtime, segments, links); shared so reopening skips parsing.
+    _science_cache: Optional[
+        tuple[Optional[float], list[tuple[str, str]], list[str]]
+    ] = None
 
     def _font_size(self, base: int) -> int:
         """Scale base font size when large-text accessibility is enabled."""
@@ -194,15 +507,8 @@ class MomentumApp:
         """Apply palette changes to already-created top-level widgets."""
         self.root.configure(bg=self._palette["bg"])
         self._configure_styles()
-        if hasattr(self, "_task_listbox"):
-            inputs = self._input_palette()
-            self._task_listbox.configure(
-                bg=self._palette["panel"],
-                fg=self._palette["fg"],
-                selectbackground=inputs["select_bg"],
-                selectforeground=self._palette["fg"],
-                font=("sans-serif", self._font_size(10)),
-            )
+        if hasattr(self, "_task_tree"):
+            self._task_tree.tag_configure("done", foreground=self._palette["muted"])
         if hasattr(self, "_image_label"):
             self._image_label.configure(bg=self._palette["bg"])
 
@@ -216,7 +522,7 @@ class MomentumApp:
             )
             fallback = Image.new("RGB", (_IMG_WIDTH, _IMG_HEIGHT), rgb)
             self._draw_title(fallback)
-            self._set_image(fallback)
+            self._set_image(fallback, key=f"solid-{rgb}")
             return
         if force_fetch or self._photo_image is None:
             threading.Thread(target=self._fetch_image, daemon=True).start()
@@ -287,9 +593,27 @@ class MomentumApp:
         self._timer_running: bool = False
         self._timer_seconds_left: int = 0
         self._timer_total: int = 0
+        self._timer_deadline: float = 0.0
+        self._timer_job: Optional[str] = None
         self._timer_task_id: Optional[int] = None
         self._timer_is_break: bool = False
         self._photo_image: Optional[ImageTk.PhotoImage] = None
+        self._photo_cache: OrderedDict[str, ImageTk.PhotoImage] = OrderedDict()
+        self._chart_cache: OrderedDict[tuple[object, ...], Image.Image] = OrderedDict()
+        self._rendered: dict[str, tuple[str, str, str]] = {}
+        self._refresh_scheduled: bool = False
+        self._settings_win: Optional[tk.Toplevel] = None
+        self._closing = threading.Event()
+        self._settings_sync: Optional[Callable[[], None]] = None
+        self._bdefs_win: Optional[tk.Toplevel] = None
+        self._bdefs_vars: dict[str, list[tk.IntVar]] = {}
+        self._bdefs_look: tuple[object, ...] = ()
+        self._results_win: Optional[tk.Toplevel] = None
+        self._results_signature: tuple[object, ...] = ()
+        self._results_photo: Optional[ImageTk.PhotoImage] = None
+        self._results_photo_src: Optional[Image.Image] = None
+        self._science_text: Optional[tk.Text] = None
+        self._science_text_key: tuple[object, ...] = ()
 
         self._style = ttk.Style()
         self._style.theme_use("clam")
@@ -323,9 +647,34 @@ class MomentumApp:
     # ------------------------------------------------------------------
 
     def _set_app_icon(self) -> None:
-        """Generate a 64x64 blue 'M' icon and apply it to the window."""
+        """Apply the 64x64 blue 'M' icon, rendering it only on a cache miss."""
+        try:
+            icon_path = cfg.get_cache_dir() / _ICON_CACHE_NAME
+        except OSError:
+            # The cache is cosmetic; an unwritable cache dir must not block startup.
+            log.debug("No cache directory for the app icon.", exc_info=True)
+            img = self._render_app_icon()
+        else:
+            try:
+                img = Image.open(icon_path)
+                img.load()
+            except (OSError, ValueError):
+                img = self._render_app_icon()
+                try:
+                    img.save(icon_path, "PNG")
+                except OSError:
+                    log.debug(
+                        "Could not cache app icon at %s.", icon_path, exc_info=True
+                    )
+        self._icon_image = ImageTk.PhotoImage(img)
+        self.root.wm_iconphoto(True, self._icon_image)
+
+    @staticmethod
+    def _render_app_icon() -> Image.Image:
+        """Draw the 64x64 blue 'M' icon."""
         size = 64
-        img = Image.new("RGBA", (size, size), (43, 43, 43, 255))
+        # The corners are opaque anyway, so skip the alpha channel.
+        img = Image.new("RGB", (size, size), (43, 43, 43))
         draw = ImageDraw.Draw(img)
         # Rounded-rect background in accent blue
         draw.rounded_rectangle([2, 2, size - 3, size - 3], radius=12, fill="#6a9fb5")
@@ -339,8 +688,7 @@ class MomentumApp:
         x = (size - tw) // 2
         y = (size - th) // 2 - bbox[1]  # compensate for font ascent offset
         draw.text((x, y), "M", fill="white", font=font)
-        self._icon_image = ImageTk.PhotoImage(img)
-        self.root.wm_iconphoto(True, self._icon_image)
+        return img
 
     def _configure_styles(self) -> None:
         """Configure ttk styles for the active theme and accessibility options."""
@@ -374,6 +722,20 @@ class MomentumApp:
             font=("sans-serif", self._font_size(10), "italic"),
             wraplength=460,
         )
+        self._style.configure(
+            "Tasks.Treeview",
+            background=self._palette["panel"],
+            fieldbackground=self._palette["panel"],
+            foreground=fg,
+            font=("sans-serif", self._font_size(10)),
+            rowheight=self._font_size(10) * 2 + 4,
+            borderwidth=0,
+        )
+        self._style.map(
+            "Tasks.Treeview",
+            background=[("selected", self._palette["selection"])],
+            foreground=[("selected", fg)],
+        )
         self._style.configure("TButton", font=("sans-serif", self._font_size(9)))
         self._style.configure(
             "Accent.TButton", font=("sans-serif", self._font_size(9), "bold")
@@ -495,23 +857,19 @@ class MomentumApp:
         list_container = ttk.Frame(task_frame)
         list_container.pack(fill=tk.BOTH, expand=True)
 
-        self._task_listbox = tk.Listbox(
+        self._task_tree = ttk.Treeview(
             list_container,
-            bg=panel_bg,
-            fg=fg,
-            selectbackground=self._palette["selection"],
-            selectforeground=fg,
-            font=("sans-serif", self._font_size(10)),
-            activestyle="none",
-            borderwidth=0,
-            highlightthickness=0,
+            show="tree",
+            selectmode="browse",
+            style="Tasks.Treeview",
         )
+        self._task_tree.tag_configure("done", foreground=self._palette["muted"])
         scrollbar = ttk.Scrollbar(
-            list_container, orient=tk.VERTICAL, command=self._task_listbox.yview
+            list_container, orient=tk.VERTICAL, command=self._task_tree.yview
         )
-        self._task_listbox.configure(yscrollcommand=scrollbar.set)
-        self._task_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self._task_listbox.bind("<Double-1>", self._on_toggle_task)
+        self._task_tree.configure(yscrollcommand=scrollbar.set)
+        self._task_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._task_tree.bind("<Double-1>", self._on_task_double_click)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # Task buttons
@@ -541,11 +899,19 @@ class MomentumApp:
 
         ttk.Label(timer_frame, text="Timer", style="Title.TLabel").pack(anchor=tk.W)
 
-        self._timer_label = ttk.Label(timer_frame, text="00:00", style="Timer.TLabel")
+        self._timer_text = tk.StringVar(value="00:00")
+        self._timer_value = tk.IntVar(value=0)
+        self._timer_label = ttk.Label(
+            timer_frame, textvariable=self._timer_text, style="Timer.TLabel"
+        )
         self._timer_label.pack(pady=(5, 0))
 
         self._timer_progress = ttk.Progressbar(
-            timer_frame, orient=tk.HORIZONTAL, length=460, mode="determinate"
+            timer_frame,
+            orient=tk.HORIZONTAL,
+            length=460,
+            mode="determinate",
+            variable=self._timer_value,
         )
         self._timer_progress.pack(pady=5)
 
@@ -573,31 +939,45 @@ class MomentumApp:
     # ------------------------------------------------------------------
 
     def _refresh_tasks(self) -> None:
-        """Reload the task list from the database."""
-        self._task_listbox.delete(0, tk.END)
-        self._task_ids: list[int] = []
-        tasks = self._task_service()
+        """Reload the task tree from the database, touching only changed rows."""
+        tasks = self._task_service().list_all_tasks(
+            include_done=self._show_completed_var.get()
+        )
+        shown = {task.id for task in tasks}
+        new_rows: dict[str, tuple[str, str, str]] = {}
+        # Parents go in before their subtasks; a subtask whose parent is hidden
+        # (e.g. a completed parent) is shown at the top level.
+        remaining = tasks
+        while remaining:
+            deferred = []
+            for task in remaining:
+                parent = str(task.parent_id) if task.parent_id in shown else ""
+                if parent and parent not in new_rows:
+                    deferred.append(task)
+                    continue
+                icon = _TASK_ICONS[task.status]
+                new_rows[str(task.id)] = (
+                    parent,
+                    f"{icon} #{task.id}  {task.title}",
+                    task.status.value,
+                )
+            if len(deferred) == len(remaining):
+                break
+            remaining = deferred
 
-        active = tasks.list_tasks(status=TaskStatus.ACTIVE)
-        pending = tasks.list_tasks(status=TaskStatus.PENDING)
+        _sync_task_tree(self._task_tree, self._rendered, new_rows)
+        self._rendered = new_rows
 
-        for task in active + pending:
-            icon = "[~]" if task.status == TaskStatus.ACTIVE else "[ ]"
-            prefix = "    " if task.is_subtask else ""
-            self._task_listbox.insert(
-                tk.END, f"{prefix}{icon} #{task.id}  {task.title}"
-            )
-            self._task_ids.append(task.id)
-
-        if self._show_completed_var.get():
-            done = tasks.list_tasks(status=TaskStatus.DONE)
-            for task in done:
-                prefix = "    " if task.is_subtask else ""
-                self._task_listbox.insert(
-                    tk.END, f"{prefix}[x] #{task.id}  {task.title}"
-                )
-                self._task_listbox.itemconfig(tk.END, fg=self._palette["muted"])
-                self._task_ids.append(task.id)
+    def _schedule_refresh(self) -> None:
+        """Coalesce task/status repaints into one trailing update."""
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            self.root.after(_REFRESH_DEBOUNCE_MS, self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._refresh_scheduled = False
+        self._refresh_tasks()
+        self._refresh_status()
 
     def _refresh_status(self) -> None:
         """Update the status bar."""
@@ -614,14 +994,14 @@ class MomentumApp:
     # ------------------------------------------------------------------
 
     def _selected_task_id(self) -> Optional[int]:
-        """Get the task ID from the current listbox selection."""
-        sel = self._task_listbox.curselection()
-        if not sel:
-            return None
-        idx: int = sel[0]
-        if idx < len(self._task_ids):
-            return self._task_ids[idx]
-        return None
+        """Get the task ID from the current tree selection."""
+        sel = self._task_tree.selection()
+        return int(sel[0]) if sel else None
+
+    def _on_task_double_click(self, event: tk.Event) -> str:  # type: ignore[type-arg]
+        """Toggle the task without also collapsing or expanding its row."""
+        self._on_toggle_task(event)
+        return "break"
 
     def _on_add_task(self) -> None:
         title = simpledialog.askstring(
@@ -629,8 +1009,7 @@ class MomentumApp:
         )
         if title and title.strip():
             self._task_service().add_task(title.strip())
-            self._refresh_tasks()
-            self._refresh_status()
+            self._schedule_refresh()
 
     def _on_complete_task(self) -> None:
         task_id = self._selected_task_id()
@@ -638,8 +1017,7 @@ class MomentumApp:
             messagebox.showinfo("Complete", "Select a task first.", parent=self.root)
             return
         self._task_service().complete_task(task_id)
-        self._refresh_tasks()
-        self._refresh_status()
+        self._schedule_refresh()
         self._nudge_label.configure(
             text=personalised_nudge(get_nudge(), self._personalisation_profile())
         )
@@ -660,8 +1038,7 @@ class MomentumApp:
             self._nudge_label.configure(
                 text=personalised_nudge(get_nudge(), self._personalisation_profile())
             )
-        self._refresh_tasks()
-        self._refresh_status()
+        self._schedule_refresh()
 
     def _on_break_down(self) -> None:
         task_id = self._selected_task_id()
@@ -671,7 +1048,7 @@ class MomentumApp:
         step = simpledialog.askstring("Break down", "Add a sub-step:", parent=self.root)
         if step and step.strip():
             self._task_service().add_subtask(parent_id=task_id, title=step.strip())
-            self._refresh_tasks()
+            self._schedule_refresh()
 
     # ------------------------------------------------------------------
     # Timer actions
@@ -688,8 +1065,9 @@ class MomentumApp:
         self._timer_is_break = is_break
         self._timer_total = minutes * 60
         self._timer_seconds_left = self._timer_total
+        self._timer_deadline = time.monotonic() + self._timer_total
         self._timer_progress["maximum"] = self._timer_total
-        self._timer_progress["value"] = 0
+        self._timer_value.set(0)
 
         task_id = self._selected_task_id()
         if not is_break and task_id is not None:
@@ -702,22 +1080,36 @@ class MomentumApp:
         self._tick()
 
     def _tick(self) -> None:
+        """Advance the countdown from a monotonic deadline.
+
+        Remaining time is derived from the clock rather than counted per
+        callback, so late or stacked Tk callbacks cannot make the timer drift.
+        """
+        self._timer_job = None
         if not self._timer_running:
             return
 
-        elapsed = self._timer_total - self._timer_seconds_left
-        self._timer_progress["value"] = elapsed
-
-        mins, secs = divmod(self._timer_seconds_left, 60)
-        self._timer_label.configure(text=f"{mins:02d}:{secs:02d}")
+        remaining_s = max(0.0, self._timer_deadline - time.monotonic())
+        self._timer_seconds_left = math.ceil(remaining_s)
+        # Paint from the idle queue so Tk can coalesce it with other redraws.
+        self.root.after_idle(self._paint_timer, self._timer_seconds_left)
 
         if self._timer_seconds_left <= 0:
             self._timer_running = False
             self._on_timer_complete()
             return
 
-        self._timer_seconds_left -= 1
-        self.root.after(1000, self._tick)
+        # Wake just after the next whole-second boundary.
+        delay_ms = int(remaining_s * 1000) % 1000 + 1
+        self._timer_job = self.root.after(delay_ms, self._tick)
+
+    def _paint_timer(self, remaining: int) -> None:
+        """Show *remaining* seconds on the timer label and progress bar."""
+        if not self._timer_running and remaining > 0:
+            return  # stopped since this paint was queued
+        self._timer_value.set(self._timer_total - remaining)
+        mins, secs = divmod(remaining, 60)
+        self._timer_text.set(f"{mins:02d}:{secs:02d}")
 
     def _on_timer_complete(self) -> None:
         self.root.bell()
@@ -750,8 +1142,11 @@ class MomentumApp:
 
     def _on_stop_timer(self) -> None:
         self._timer_running = False
-        self._timer_label.configure(text="00:00")
-        self._timer_progress["value"] = 0
+        if self._timer_job is not None:
+            self.root.after_cancel(self._timer_job)
+            self._timer_job = None
+        self._timer_text.set("00:00")
+        self._timer_value.set(0)
 
     # ------------------------------------------------------------------
     # Nudge
@@ -963,8 +1358,22 @@ class MomentumApp:
     # ------------------------------------------------------------------
 
     def _on_settings(self) -> None:
-        """Open the settings dialog."""
+        """Open the settings dialog.
+
+        The window is built once and hidden on close; reopening refreshes its
+        values from config. Theme and accessibility changes rebuild it so new
+        colours and font sizes apply.
+        """
+        if self._settings_win is not None and self._settings_win.winfo_exists():
+            if self._settings_sync is not None:
+                self._settings_sync()
+            self._settings_win.deiconify()
+            self._settings_win.lift()
+            self._settings_win.grab_set()
+            return
+
         win = tk.Toplevel(self.root)
+        self._settings_win = win
         win.title("Settings")
         win.geometry("520x680")
         win.configure(bg=self._palette["bg"])
@@ -992,26 +1401,53 @@ class MomentumApp:
         cloud_frame = ttk.Frame(win)
         cloud_frame.pack(fill=tk.X, padx=12)
 
+        cloud_buttons: list[ttk.Button] = []
+
         def _sync(provider: str) -> None:
-            result = cfg.set_cloud_sync(provider)
-            if result is None:
-                messagebox.showwarning(
-                    "Not found",
-                    f"Could not find {provider} folder on this system.",
-                    parent=win,
+            # Probing cloud folders can stall on network mounts, so do it on a
+            # worker thread and report back through the main loop.
+            previous_text = path_label.cget("text")
+            for button in cloud_buttons:
+                button.state(["disabled"])
+            path_label.configure(text="Checking\u2026")
+
+            def _probe() -> None:
+                try:
+                    result = cfg.set_cloud_sync(provider)
+                    error = None
+                except RuntimeError as exc:
+                    result, error = None, str(exc)
+                self.root.after(0, _probe_done, result, error)
+
+            def _probe_done(result: Optional[AppConfig], error: Optional[str]) -> None:
+                if result is not None:
+                    self._reconnect_db()
+                if not win.winfo_exists():
+                    return
+                for button in cloud_buttons:
+                    button.state(["!disabled"])
+                if result is None:
+                    path_label.configure(text=previous_text)
+                    messagebox.showwarning(
+                        "Not found" if error is None else "Sync failed",
+                        error or f"Could not find {provider} folder on this system.",
+                        parent=win,
+                    )
+                    return
+                path_label.configure(text=result.db_path)
+                messagebox.showinfo(
+                    "Sync configured", f"Database: {result.db_path}", parent=win
                 )
-                return
-            path_label.configure(text=result.db_path)
-            self._reconnect_db()
-            messagebox.showinfo(
-                "Sync configured", f"Database: {result.db_path}", parent=win
-            )
+
+            threading.Thread(target=_probe, daemon=True).start()
 
         for provider in ("OneDrive", "Dropbox", "Google Drive"):
             key = provider.lower().replace(" ", "-")
-            ttk.Button(cloud_frame, text=provider, command=lambda p=key: _sync(p)).pack(
-                side=tk.LEFT, padx=2
+            button = ttk.Button(
+                cloud_frame, text=provider, command=lambda p=key: _sync(p)
             )
+            button.pack(side=tk.LEFT, padx=2)
+            cloud_buttons.append(button)
 
         # Custom path
         ttk.Label(win, text="Or set a custom path", style="Title.TLabel").pack(
@@ -1031,7 +1467,7 @@ class MomentumApp:
         path_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 4))
 
         def _browse_custom() -> None:
-            initial_dir = path_entry.get().strip() or str(resolved.parent)
+            initial_dir = path_entry.get().strip() or str(cfg.get_db_path().parent)
             chosen = filedialog.askdirectory(parent=win, initialdir=initial_dir)
             if chosen:
                 path_entry.delete(0, tk.END)
@@ -1095,6 +1531,7 @@ class MomentumApp:
         def _reopen_settings() -> None:
             if win.winfo_exists():
                 win.destroy()
+            self._settings_win = None
             self.root.after_idle(self._on_settings)
 
         def _set_theme() -> None:
@@ -1184,7 +1621,13 @@ class MomentumApp:
         ttk.Button(btn_frame, text="Reset to default", command=_reset).pack(
             side=tk.LEFT
         )
-        ttk.Button(btn_frame, text="Close", command=win.destroy).pack(side=tk.RIGHT)
+
+        def _hide() -> None:
+            win.grab_release()
+            win.withdraw()
+
+        win.protocol("WM_DELETE_WINDOW", _hide)
+        ttk.Button(btn_frame, text="Close", command=_hide).pack(side=tk.RIGHT)
 
         # --- Data management ---
         ttk.Label(win, text="Data Management", style="Title.TLabel").pack(
@@ -1275,6 +1718,20 @@ class MomentumApp:
             check_now_frame, text="Check for updates now", command=_check_updates_now
         ).pack(side=tk.LEFT)
 
+        def _sync_from_config() -> None:
+            conf = cfg.load_config()
+            path_label.configure(
+                text=conf.db_path if conf.db_path else f"{cfg.get_db_path()} (default)"
+            )
+            pos_var.set(conf.window_position.value)
+            theme_var.set(conf.theme_mode.value)
+            large_text_var.set(conf.accessibility_large_text)
+            high_contrast_var.set(conf.accessibility_high_contrast)
+            reduce_visual_var.set(conf.accessibility_reduce_visual_load)
+            check_startup_var.set(conf.check_updates_at_startup)
+
+        self._settings_sync = _sync_from_config
+
     def _on_browse_db(self) -> None:
         """Open a database browser window."""
         win = tk.Toplevel(self.root)
@@ -1393,19 +1850,12 @@ class MomentumApp:
     # ------------------------------------------------------------------
 
     def _on_help(self) -> None:
-        """Show the README in a scrollable window with rendered markdown."""
-        readme_path = Path(__file__).resolve().parent.parent / "README.md"
-        if readme_path.exists():
-            content = readme_path.read_text(encoding="utf-8")
-        else:
-            content = (
-                "# Momentum\n\n"
-                "A gentle tool for executive dysfunction support.\n\n"
-                "## Commands\n\n"
-                "- **Add task** -- add something you need to do\n"
-                "- **Complete** -- mark a selected task as done\n"
-                "- **Break down** -- split a task into smaller steps\n"
-            )
+        """Show the README in a scrollable window with rendered markdown.
+
+        The file is read and parsed (or loaded from the parse cache) on a
+        worker thread so the window paints immediately.
+        """
+        readme_path = _README_PATH
 
         win = tk.Toplevel(self.root)
         win.title("How to Use")
@@ -1426,7 +1876,34 @@ class MomentumApp:
             pady=12,
         )
         text.pack(fill=tk.BOTH, expand=True)
-        self._render_markdown(text, content)
+        text.insert(tk.END, "Loading\u2026")
+        text.configure(state=tk.DISABLED)
+
+        def _load() -> None:
+            try:
+                segments, links = _load_markdown_segments(readme_path, _HELP_FALLBACK)
+            except Exception:
+                # Always hand the window some content rather than leave it
+                # stuck on "Loading...".
+                log.exception("Could not load help text from %s.", readme_path)
+                segments, links = _parse_markdown(_HELP_FALLBACK)
+            self.root.after(0, self._show_help_content, win, text, segments, links)
+
+        threading.Thread(target=_load, daemon=True).start()
+
+    def _show_help_content(
+        self,
+        win: tk.Toplevel,
+        text: scrolledtext.ScrolledText,
+        segments: list[tuple[str, str]],
+        links: list[str],
+    ) -> None:
+        """Insert parsed help markdown into *text* (main thread)."""
+        if not win.winfo_exists():
+            return
+        text.configure(state=tk.NORMAL)
+        text.delete("1.0", tk.END)
+        self._apply_segments(text, segments, links)
         text.configure(state=tk.DISABLED)
 
     # ------------------------------------------------------------------
@@ -1435,6 +1912,15 @@ class MomentumApp:
 
     def _render_markdown(self, widget: scrolledtext.ScrolledText, md: str) -> None:
         """Insert *md* into *widget* with basic visual formatting."""
+        self._apply_segments(widget, *_parse_markdown(md))
+
+    def _apply_segments(
+        self,
+        widget: scrolledtext.ScrolledText,
+        segments: list[tuple[str, str]],
+        links: list[str],
+    ) -> None:
+        """Configure markdown tags on *widget* and insert parsed *segments*."""
         inputs = self._input_palette()
         h_fg = self._palette["accent"]
         body_fg = self._palette["fg"]
@@ -1506,127 +1992,61 @@ class MomentumApp:
             background=code_bg,
         )
 
-        link_count = 0
-
-        def _make_link(url: str):
-            return lambda _e: webbrowser.open(url)
-
-        def _insert_inline(line: str, base_tag: str) -> None:
-            """Insert a line handling **bold**, `code`, and [links](url)."""
-            nonlocal link_count
-            pattern = re.compile(r"(\*\*(.+?)\*\*|`([^`]+)`|\[([^\]]+)\]\(([^)]+)\))")
-            pos = 0
-            for m in pattern.finditer(line):
-                # Text before this match
-                if m.start() > pos:
-                    widget.insert(tk.END, line[pos : m.start()], base_tag)
-                if m.group(2) is not None:  # **bold**
-                    widget.insert(tk.END, m.group(2), "bold")
-                elif m.group(3) is not None:  # `inline code`
-                    widget.insert(tk.END, m.group(3), "inline_code")
-                elif m.group(4) is not None:  # [text](url)
-                    tag = f"md_link_{link_count}"
-                    link_count += 1
-                    widget.tag_configure(
-                        tag,
-                        font=("sans-serif", self._font_size(10)),
-                        foreground=inputs["link"],
-                        underline=True,
-                    )
-                    widget.tag_bind(tag, "<Button-1>", _make_link(m.group(5)))
-                    widget.tag_bind(
-                        tag, "<Enter>", lambda _e: widget.configure(cursor="hand2")
-                    )
-                    widget.tag_bind(
-                        tag, "<Leave>", lambda _e: widget.configure(cursor="")
-                    )
-                    widget.insert(tk.END, m.group(4), tag)
-                pos = m.end()
-            if pos < len(line):
-                widget.insert(tk.END, line[pos:], base_tag)
-
-        in_code_block = False
-        lines = md.splitlines()
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            # Code block fences
-            if line.startswith("```"):
-                if not in_code_block:
-                    in_code_block = True
-                    i += 1
-                    continue
-                else:
-                    in_code_block = False
-                    widget.insert(tk.END, "\n")
-                    i += 1
-                    continue
+        for index, url in enumerate(links):
+            tag = f"md_link_{index}"
+            widget.tag_configure(
+                tag,
+                font=("sans-serif", self._font_size(10)),
+                foreground=inputs["link"],
+                underline=True,
+            )
+            widget.tag_bind(tag, "<Button-1>", _make_link(url))
+            # Use the event's widget so the cursor also follows in Text peers.
+            widget.tag_bind(
+                tag, "<Enter>", lambda e: e.widget.configure(cursor="hand2")
+            )
+            widget.tag_bind(tag, "<Leave>", lambda e: e.widget.configure(cursor=""))
 
-            if in_code_block:
-                widget.insert(tk.END, line + "\n", "code_block")
-                i += 1
-                continue
-
-            # Blank line
-            if not line.strip():
-                widget.insert(tk.END, "\n")
-                i += 1
-                continue
-
-            # Headings
-            if line.startswith("### "):
-                widget.insert(tk.END, line[4:] + "\n", "h3")
-                i += 1
-                continue
-            if line.startswith("## "):
-                widget.insert(tk.END, line[3:] + "\n", "h2")
-                i += 1
-                continue
-            if line.startswith("# "):
-                widget.insert(tk.END, line[2:] + "\n", "h1")
-                i += 1
-                continue
-
-            # Table separator rows (|---|---|
-            if re.match(r"^\|[-\s|:]+\|$", line):
-                i += 1
-                continue
-
-            # Table rows
-            if line.startswith("|") and line.endswith("|"):
-                cells = [c.strip() for c in line.strip("|").split("|")]
-                row = "  ".join(
-                    f"{c:<30}" if ci == 0 else c for ci, c in enumerate(cells)
-                )
-                _insert_inline(row + "\n", "table_row")
-                i += 1
-                continue
-
-            # Bullet list
-            if line.startswith("- ") or line.startswith("* "):
-                _insert_inline(
-                    "  "
-                    + line[:2].replace("-", "--").replace("*", "--")
-                    + " "
-                    + line[2:]
-                    + "\n",
-                    "bullet",
-                )
-                i += 1
-                continue
+        _insert_runs(widget, segments)
 
-            # Regular paragraph line
-            _insert_inline(line + "\n", "body")
-            i += 1
+    def _science_segments(self) -> tuple[list[tuple[str, str]], list[str]]:
+        """Return parsed SCIENCE.md, reusing the in-memory parse while unchanged."""
+        science_path = _SCIENCE_PATH
+        try:
+            mtime: Optional[float] = science_path.stat().st_mtime
+        except OSError:
+            mtime = None
+        cached = MomentumApp._science_cache
+        if cached is not None and cached[0] == mtime:
+            return cached[1], cached[2]
+        segments, links = _load_markdown_segments(science_path, _SCIENCE_FALLBACK)
+        MomentumApp._science_cache = (mtime, segments, links)
+        return segments, links
+
+    def _science_source(self) -> tk.Text:
+        """Return a hidden Text holding rendered SCIENCE.md.
+
+        Each science window shows a peer of this widget, so the document is
+        inserted and tagged once rather than on every opening.  It is rebuilt
+        when SCIENCE.md is re-parsed or the theme or font size changes.
+        """
+        segments, links = self._science_segments()
+        key = (segments, links, tuple(self._palette.items()), self._font_size(10))
+        source = self._science_text
+        if source is not None and key == self._science_text_key:
+            return source
+        if source is not None:
+            source.destroy()
+        source = tk.Text(self.root)
+        self._apply_segments(source, segments, links)
+        source.configure(state=tk.DISABLED)
+        self._science_text = source
+        self._science_text_key = key
+        return source
 
     def _on_science(self) -> None:
         """Show the scientific rationale loaded from SCIENCE.md."""
-        science_path = Path(__file__).resolve().parent.parent / "SCIENCE.md"
-        if science_path.exists():
-            content = science_path.read_text(encoding="utf-8")
-        else:
-            content = "# The Science Behind Momentum\n\nScience document not found."
+        source = self._science_source()
 
         win = tk.Toplevel(self.root)
         win.title("The Science Behind Momentum")
@@ -1635,7 +2055,8 @@ class MomentumApp:
         win.transient(self.root)
         inputs = self._input_palette()
 
-        text = scrolledtext.ScrolledText(
+        text = _TextPeer(
+            source,
             win,
             wrap=tk.WORD,
             bg=inputs["input_bg"],
@@ -1645,10 +2066,16 @@ class MomentumApp:
             highlightthickness=0,
             padx=16,
             pady=12,
+            state=tk.DISABLED,
         )
-        text.pack(fill=tk.BOTH, expand=True)
-        self._render_markdown(text, content)
-        text.configure(state=tk.DISABLED)
+        if not text.is_peer:
+            text.configure(state=tk.NORMAL)
+            self._apply_segments(text, *self._science_segments())
+            text.configure(state=tk.DISABLED)
+        scrollbar = ttk.Scrollbar(win, orient=tk.VERTICAL, command=text.yview)
+        text.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
     def _on_about(self) -> None:
         """Show a brief about dialog."""
@@ -1681,7 +2108,24 @@ class MomentumApp:
         ):
             return
 
+        # The form is built once and hidden on close; reopening only resets
+        # the answers.  A theme or font change since then forces a rebuild.
+        look = (tuple(self._palette.items()), self._font_size(9))
+        cached = self._bdefs_win
+        if cached is not None and cached.winfo_exists():
+            if look == self._bdefs_look:
+                for domain_vars in self._bdefs_vars.values():
+                    for var in domain_vars:
+                        var.set(1)
+                cached.deiconify()
+                cached.lift()
+                cached.grab_set()
+                return
+            cached.destroy()
+
         win = tk.Toplevel(self.root)
+        self._bdefs_win = win
+        self._bdefs_look = look
         win.title("Executive Function Self-Assessment")
         win.geometry("560x520")
         win.configure(bg=self._palette["bg"])
@@ -1693,6 +2137,13 @@ class MomentumApp:
         scrollbar = ttk.Scrollbar(win, orient=tk.VERTICAL, command=canvas.yview)
         inner = ttk.Frame(canvas)
 
+        def _hide() -> None:
+            win.grab_release()
+            win.withdraw()
+            canvas.yview_moveto(0)
+
+        win.protocol("WM_DELETE_WINDOW", _hide)
+
         inner.bind(
             "<Configure>", lambda _e: canvas.configure(scrollregion=canvas.bbox("all"))
         )
@@ -1745,12 +2196,13 @@ class MomentumApp:
                     ).pack(side=tk.LEFT)
                 row += 1
             vars_map[domain] = domain_vars
+        self._bdefs_vars = vars_map
 
         def _submit() -> None:
             answers = {d: [v.get() for v in vs] for d, vs in vars_map.items()}
             create_model = score_bdefs(answers)
             saved = self._assessment_service().save_result(create_model)
-            win.destroy()
+            _hide()
             self._show_bdefs_result(saved)
 
         ttk.Button(inner, text="Submit", command=_submit, style="Accent.TButton").grid(
@@ -1882,10 +2334,8 @@ class MomentumApp:
         ):
             return
 
-        import time as _time
-
         trials = generate_stroop_trials()
-        state = {"idx": 0, "correct": 0, "total_time": 0.0, "t0": 0.0, "per_trial": []}
+        state = _StroopState()
 
         win = tk.Toplevel(self.root)
         win.title("Stroop Colour-Word Test")
@@ -1937,7 +2387,7 @@ class MomentumApp:
         feedback_label.pack(pady=4)
 
         def _show_trial() -> None:
-            idx = state["idx"]
+            idx = state.idx
             if idx >= len(trials):
                 _finish()
                 return
@@ -1948,26 +2398,30 @@ class MomentumApp:
             progress_label.configure(text=f"Trial {idx + 1} of {len(trials)}")
             entry_var.set("")
             feedback_label.configure(text="")
-            state["t0"] = _time.monotonic()
+            state.waiting = False
+            state.t0 = time.monotonic()
 
         def _on_submit(_event=None) -> None:
-            elapsed = _time.monotonic() - state["t0"]
+            if state.waiting:
+                return
+            elapsed = time.monotonic() - state.t0
             answer = entry_var.get().strip().lower()
             if not answer:
                 return
-            trial = trials[state["idx"]]
+            trial = trials[state.idx]
             is_correct = answer == trial.ink_colour
-            state["per_trial"].append((is_correct, elapsed))
-            state["total_time"] += elapsed
+            state.per_trial.append((is_correct, elapsed))
+            state.total_time += elapsed
             if is_correct:
-                state["correct"] += 1
+                state.correct += 1
                 feedback_label.configure(text="Correct!", foreground="#60c060")
             else:
                 feedback_label.configure(
                     text=f"The colour was {trial.ink_colour}.",
                     foreground="#e06060",
                 )
-            state["idx"] += 1
+            state.idx += 1
+            state.waiting = True
             win.after(600, _show_trial)
 
         entry.bind("<Return>", _on_submit)
@@ -1975,9 +2429,9 @@ class MomentumApp:
         def _finish() -> None:
             result = StroopResult(
                 trials=len(trials),
-                correct=state["correct"],
-                total_time_s=state["total_time"],
-                per_trial=state["per_trial"],
+                correct=state.correct,
+                total_time_s=state.total_time,
+                per_trial=state.per_trial,
             )
             create_model = score_stroop(result)
             saved = self._assessment_service().save_result(create_model)
@@ -1994,6 +2448,36 @@ class MomentumApp:
 
     # --- shared result display helpers -----------------------------------
 
+    def _cached_chart(
+        self,
+        render: Callable[..., Image.Image],
+        latest: "AssessmentResult",
+        previous: Optional["AssessmentResult"],
+        *,
+        title: str,
+    ) -> Image.Image:
+        """Render a BDEFS chart, reusing the image while its inputs are unchanged.
+
+        The key covers every field the charts read, so a newly saved result
+        simply misses; nothing needs invalidating.
+        """
+
+        def ident(r: Optional["AssessmentResult"]) -> object:
+            if r is None:
+                return None
+            return (r.id, r.score, tuple(r.domain_scores.items()))
+
+        key = (render.__name__, title, ident(latest), ident(previous))
+        image = self._chart_cache.get(key)
+        if image is not None:
+            self._chart_cache.move_to_end(key)
+            return image
+        image = render(latest=latest, previous=previous, title=title)
+        self._chart_cache[key] = image
+        if len(self._chart_cache) > _CHART_CACHE_SIZE:
+            self._chart_cache.popitem(last=False)
+        return image
+
     def _show_bdefs_result(self, saved: "AssessmentResult") -> None:
         """Open a results window with a motivating chart and score breakdown."""
 
@@ -2008,10 +2492,8 @@ class MomentumApp:
         rwin.configure(bg=self._palette["bg"])
         rwin.transient(self.root)
 
-        chart_img = bdefs_radar(
-            latest=saved,
-            previous=previous,
-            title="Executive Function Profile",
+        chart_img = self._cached_chart(
+            bdefs_radar, saved, previous, title="Executive Function Profile"
         )
         chart_tk = ImageTk.PhotoImage(chart_img)
         chart_label = tk.Label(rwin, image=chart_tk, bg=self._palette["bg"])  # type: ignore[arg-type]
@@ -2027,11 +2509,11 @@ class MomentumApp:
             style="Title.TLabel",
         ).pack(anchor=tk.W)
         for d, s in saved.domain_scores.items():
-            n_qs = len(BDEFS_QUESTIONS[d])
-            ttk.Label(score_frame, text=f"  {d}: {s}/{n_qs * 4}", style="TLabel").pack(
-                anchor=tk.W
-            )
-            advice = domain_advice(d, s, n_qs * 4)
+            domain_max = bdefs_domain_max_score(d)
+            ttk.Label(
+                score_frame, text=f"  {d}: {s}/{domain_max}", style="TLabel"
+            ).pack(anchor=tk.W)
+            advice = domain_advice(d, s, domain_max)
             if advice:
                 ttk.Label(
                     score_frame,
@@ -2052,11 +2534,31 @@ class MomentumApp:
         """Display past assessment results with charts in a scrollable window."""
         results = self._assessment_service().list_results(limit=50)
 
+        # Closing only hides the window.  The 50-row query is cheap next to
+        # the charts and widgets, so it doubles as the staleness check: the
+        # old window is shown again unless results were added or removed
+        # (from here, the CLI or the DB browser) or the theme changed.
+        signature = (
+            tuple(self._palette.items()),
+            self._font_size(10),
+            tuple((r.id, r.taken_at) for r in results),
+        )
+        cached = self._results_win
+        if cached is not None and cached.winfo_exists():
+            if signature == self._results_signature:
+                cached.deiconify()
+                cached.lift()
+                return
+            cached.destroy()
+
         win = tk.Toplevel(self.root)
+        self._results_win = win
+        self._results_signature = signature
         win.title("Assessment Results")
         win.geometry("680x780")
         win.configure(bg=self._palette["bg"])
         win.transient(self.root)
+        win.protocol("WM_DELETE_WINDOW", win.withdraw)
         inputs = self._input_palette()
 
         # Scrollable canvas for the whole window
@@ -2072,9 +2574,6 @@ class MomentumApp:
         outer_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Keep references to Tk images to prevent garbage collection.
-        self._results_images: list[ImageTk.PhotoImage] = []
-
         bdefs_results = [
             r for r in results if r.assessment_type == AssessmentType.BDEFS
         ]
@@ -2104,13 +2603,25 @@ class MomentumApp:
             if bdefs_results:
                 latest_r = bdefs_results[0]  # most recent first
                 prev_r = bdefs_results[1] if len(bdefs_results) > 1 else None
-                glow_img = bdefs_momentum_glow(
-                    latest=latest_r,
-                    previous=prev_r,
+                glow_img = self._cached_chart(
+                    bdefs_momentum_glow,
+                    latest_r,
+                    prev_r,
                     title="Latest Momentum Reserve Profile",
                 )
-                glow_tk = ImageTk.PhotoImage(glow_img)
-                self._results_images.append(glow_tk)
+                # Reuse the Tk image across rebuilds: untouched when the chart
+                # came from the cache unchanged, refilled when only the pixels
+                # differ, reallocated only on a size change.
+                glow_tk = self._results_photo
+                if glow_tk is None or glow_img.size != (
+                    glow_tk.width(),
+                    glow_tk.height(),
+                ):
+                    glow_tk = ImageTk.PhotoImage(glow_img)
+                    self._results_photo = glow_tk  # also keeps it from GC
+                elif glow_img is not self._results_photo_src:
+                    glow_tk.paste(glow_img)
+                self._results_photo_src = glow_img
                 tk.Label(content, image=glow_tk, bg=self._palette["bg"]).pack(
                     padx=8, pady=(8, 0)
                 )
@@ -2146,51 +2657,52 @@ class MomentumApp:
                 foreground=self._palette["muted"],
             )
 
+            # Collected as (chars, tag) runs, merging neighbours that share a
+            # tag, and handed to Tk in one insert call.
+            runs: list[tuple[str, str]] = []
+
+            def add(chars: str, tag: str) -> None:
+                if runs and runs[-1][1] == tag:
+                    runs[-1] = (runs[-1][0] + chars, tag)
+                else:
+                    runs.append((chars, tag))
+
             for r in results:
                 taken = r.taken_at.strftime("%Y-%m-%d %H:%M")
-                text.insert(
-                    tk.END,
-                    f"{r.assessment_type.value.upper()}  --  {taken}\n",
-                    "heading",
-                )
+                add(f"{r.assessment_type.value.upper()}  --  {taken}\n", "heading")
                 if r.assessment_type == AssessmentType.BISBAS:
-                    text.insert(
-                        tk.END,
+                    add(
                         "  Endorsement score: "
                         f"{bisbas_normalized_total_score(r.score)}/{bisbas_effective_max_score()}\n",
                         "body",
                     )
                 else:
-                    text.insert(tk.END, f"  Score: {r.score}/{r.max_score}\n", "body")
+                    add(f"  Score: {r.score}/{r.max_score}\n", "body")
                 if r.assessment_type == AssessmentType.BDEFS:
                     for d, s in r.domain_scores.items():
-                        text.insert(tk.END, f"    {d}: {s}\n", "body")
-                    text.insert(
-                        tk.END, f"  {interpret_bdefs(r.score, r.max_score)}\n", "interp"
-                    )
+                        add(f"    {d}: {s}\n", "body")
+                    add(f"  {interpret_bdefs(r.score, r.max_score)}\n", "interp")
                 elif r.assessment_type == AssessmentType.STROOP:
                     avg_ms = r.domain_scores.get("avg_time_ms", 0)
-                    text.insert(tk.END, f"  Avg response: {avg_ms} ms\n", "body")
-                    text.insert(
-                        tk.END,
+                    add(f"  Avg response: {avg_ms} ms\n", "body")
+                    add(
                         f"  {interpret_stroop(r.score, r.max_score, avg_ms)}\n",
                         "interp",
                     )
                 elif r.assessment_type == AssessmentType.BISBAS:
                     for d, s in r.domain_scores.items():
                         max_domain = bisbas_effective_domain_max_score(d) or 1
-                        text.insert(
-                            tk.END,
+                        add(
                             "    "
                             f"{d}: {bisbas_normalized_domain_score(d, s)}/{max_domain}\n",
                             "body",
                         )
-                    text.insert(
-                        tk.END,
+                    add(
                         f"  {interpret_bisbas(r.score, r.max_score, r.domain_scores)}\n",
                         "interp",
                     )
-                text.insert(tk.END, "\n")
+                add("\n", "")
+            _insert_runs(text, runs)
 
             text.configure(state=tk.DISABLED)
 
@@ -2199,52 +2711,109 @@ class MomentumApp:
     # ------------------------------------------------------------------
 
     def _fetch_image(self) -> None:
-        """Download a random peaceful photo in a background thread.
+        """Load a random peaceful photo (disk cache, then network) off-thread.
 
-        Retries up to 5 times with different photos if a fetch fails.
+        Tries up to 5 different photos, two at a time, and shows whichever
+        arrives first, so one slow request no longer delays the rest.  Then
+        falls back to any banner cached by an earlier run, and gives up
+        quietly once the app is closing.
         """
-        attempts = min(5, len(_PEACEFUL_PHOTOS))
-        tried: set[str] = set()
-        for _ in range(attempts):
-            photo_id = random.choice(_PEACEFUL_PHOTOS)
-            if photo_id in tried:
-                continue
-            tried.add(photo_id)
-            url = (
-                f"https://images.unsplash.com/{photo_id}"
-                f"?w={_IMG_WIDTH}&h={_IMG_HEIGHT}&fit=crop&crop=center&auto=format&q=80"
-            )
+        photos = _load_photos()
+        attempts = min(5, len(photos))
+        candidates = random.sample(photos, attempts)
+        tried = set(candidates)
+        arrivals: queue.Queue[tuple[str, Optional[Image.Image]]] = queue.Queue()
+
+        def _load(photo_id: str) -> None:
+            image: Optional[Image.Image] = None
             try:
-                req = urllib.request.Request(
-                    url, headers={"User-Agent": "Momentum/0.1"}
+                image = Image.open(
+                    io.BytesIO(get_banner(photo_id, _IMG_WIDTH, _IMG_HEIGHT))
                 )
-                with urllib.request.urlopen(req, timeout=8) as resp:
-                    data = resp.read()
-                image = Image.open(io.BytesIO(data))
-                image = image.resize((_IMG_WIDTH, _IMG_HEIGHT), Image.LANCZOS)
-                self._draw_title(image)
-                self.root.after(0, self._set_image, image)
-                return
+                image.load()
             except Exception:
-                log.debug(
-                    "Image fetch failed for %s; retrying.", photo_id, exc_info=True
-                )
+                log.debug("Image fetch failed for %s.", photo_id, exc_info=True)
+                image = None
+            arrivals.put((photo_id, image))
+
+        def _launch() -> None:
+            threading.Thread(
+                target=_load, args=(candidates.pop(),), daemon=True
+            ).start()
+
+        in_flight = 0
+        while candidates and in_flight < _FETCH_PARALLEL:
+            _launch()
+            in_flight += 1
+        while in_flight:
+            photo_id, image = arrivals.get()
+            in_flight -= 1
+            if self._closing.is_set():
+                return
+            if image is not None:
+                try:
+                    # Drawn here, not in the loaders: FreeType faces are
+                    # not safe to share between threads.
+                    self._draw_title(image)
+                except Exception:
+                    log.debug("Could not title banner %s.", photo_id, exc_info=True)
+                else:
+                    self._post_banner(image, photo_id)
+                    return
+            if candidates:
+                _launch()
+                in_flight += 1
         log.warning("Could not fetch any peaceful image after %d attempts.", attempts)
+        # Offline: reuse any banner from an earlier run before going solid.
+        try:
+            cached = [
+                p for p in cached_photo_ids(_IMG_WIDTH, _IMG_HEIGHT) if p not in tried
+            ]
+        except OSError:
+            log.debug("Could not list cached banners.", exc_info=True)
+            cached = []
+        if cached and not self._closing.is_set():
+            photo_id = random.choice(cached)
+            try:
+                image = Image.open(
+                    io.BytesIO(get_banner(photo_id, _IMG_WIDTH, _IMG_HEIGHT))
+                )
+                self._draw_title(image)
+            except Exception:
+                log.debug("Cached banner %s unreadable.", photo_id, exc_info=True)
+            else:
+                self._post_banner(image, photo_id)
+                return
         # Fallback: solid-colour banner with title text
         fallback = Image.new("RGB", (_IMG_WIDTH, _IMG_HEIGHT), (58, 90, 106))
         self._draw_title(fallback)
-        self.root.after(0, self._set_image, fallback)
+        self._post_banner(fallback, "solid-fallback")
+
+    def _post_banner(self, image: Image.Image, key: str) -> None:
+        """Hand a banner from the worker thread to the Tk main loop."""
+        if self._closing.is_set():
+            return
+        try:
+            self.root.after(0, self._apply_banner, image, key)
+        except (RuntimeError, tk.TclError):
+            log.debug("Main loop gone; dropping banner %s.", key)
+
+    def _apply_banner(self, image: Image.Image, key: str) -> None:
+        """Show a fetched banner if the window still exists (main thread)."""
+        try:
+            if not self.root.winfo_exists():
+                return
+        except tk.TclError:
+            return
+        self._set_image(image, key)
 
     @staticmethod
     def _draw_title(image: Image.Image) -> None:
         """Draw 'Momentum' centred on the banner with a drop shadow."""
         draw = ImageDraw.Draw(image)
-        try:
-            font = ImageFont.truetype("DejaVuSans-Bold.ttf", 32)
-        except OSError:
-            font = ImageFont.load_default(size=32)
-        text = "Momentum"
-        bbox = draw.textbbox((0, 0), text, font=font)
+        font = _get_title_font()
+        text = _TITLE_TEXT
+        bbox = _title_bbox()
         tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
         x = (image.width - tw) // 2
         y = (image.height - th) // 2
@@ -2253,10 +2822,24 @@ class MomentumApp:
         # main text
         draw.text((x, y), text, fill="white", font=font)
 
-    def _set_image(self, image: Image.Image) -> None:
-        """Display the fetched image in the banner label (main thread)."""
-        self._photo_image = ImageTk.PhotoImage(image)
-        self._image_label.configure(image=self._photo_image, height=_IMG_HEIGHT)
+    def _set_image(self, image: Image.Image, key: Optional[str] = None) -> None:
+        """Display the fetched image in the banner label (main thread).
+
+        PhotoImages are kept in a small LRU keyed by photo ID so re-showing a
+        banner swaps a reference instead of rebuilding the Tk image.
+        """
+        if key is None:
+            photo = ImageTk.PhotoImage(image)
+        elif key in self._photo_cache:
+            self._photo_cache.move_to_end(key)
+            photo = self._photo_cache[key]
+        else:
+            photo = ImageTk.PhotoImage(image)
+            self._photo_cache[key] = photo
+            if len(self._photo_cache) > _PHOTO_CACHE_SIZE:
+                self._photo_cache.popitem(last=False)
+        self._photo_image = photo
+        self._image_label.configure(image=photo, height=_IMG_HEIGHT)
 
     # ------------------------------------------------------------------
     # Run
@@ -2265,6 +2848,7 @@ class MomentumApp:
     def run(self) -> None:
         """Start the tkinter main loop."""
         self.root.mainloop()
+        self._closing.set()
         self.conn.close()
 
 
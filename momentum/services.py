@@ -99,6 +99,7 @@ class TaskServiceFactory:
     add_subtask: Callable[[int, str], Task]
     get_task: Callable[[int], Task | None]
     list_tasks: Callable[[TaskStatus | None], list[Task]]
+    list_all_tasks: Callable[[bool], list[Task]]
     complete_task: Callable[[int], Task | None]
     reopen_task: Callable[[int], Task | None]
     activate_task: Callable[[int], Task | None]
@@ -122,6 +123,9 @@ def task_service(conn: sqlite3.Connection) -> TaskServiceFactory:
     def list_tasks(status: TaskStatus | None = None) -> list[Task]:
         return db.list_tasks(conn, status=status)
 
+    def list_all_tasks(include_done: bool = True) -> list[Task]:
+        return db.list_all_tasks(conn, include_done=include_done)
+
     def complete_task(task_id: int) -> Task | None:
         return db.complete_task(conn, task_id)
 
@@ -147,6 +151,7 @@ def task_service(conn: sqlite3.Connection) -> TaskServiceFactory:
         add_subtask=add_subtask,
         get_task=get_task,
         list_tasks=list_tasks,
+        list_all_tasks=list_all_tasks,
         complete_task=complete_task,
         reopen_task=reopen_task,
         activate_task=activate_task,
@@ -196,6 +201,10 @@ class TaskService:
         """List tasks with an optional status filter."""
         return self._factory.list_tasks(status)
 
+    def list_all_tasks(self, *, include_done: bool = True) -> list[Task]:
+        """List tasks ordered active, pending, then done."""
+        return self._factory.list_all_tasks(include_done)
+
     def complete_task(self, task_id: int) -> Task | None:
         """Mark a task as completed."""
         return self._factory.complete_task(task_id)
@@ -277,7 +286,7 @@ class AssessmentService:
     def _history_entry(self, result: AssessmentResult) -> AssessmentHistoryEntry:
         """Build a formatted history entry for one saved result."""
         from momentum.assessments import (
-            BDEFS_QUESTIONS,
+            bdefs_domain_max_score,
             bisbas_domain_advice,
             bisbas_effective_domain_max_score,
             bisbas_effective_max_score,
@@ -300,7 +309,7 @@ class AssessmentService:
 
         if result.assessment_type == AssessmentType.BDEFS:
             for domain, score in result.domain_scores.items():
-                max_domain = len(BDEFS_QUESTIONS.get(domain, [])) * 4
+                max_domain = bdefs_domain_max_score(domain)
                 lines.append(f"    {domain}: {score}")
                 if max_domain:
                     advice = domain_advice(domain, score, max_domain)
@@ -1,5 +1,7 @@
 """Backward compatibility shim for timer module."""
 
+import threading
+
 from momentum.domain.timer import (
     ClockPort,
     ConsoleEncouragement,
@@ -11,6 +13,7 @@ from momentum.domain.timer import (
     TimerProgressPort,
     TimerService,
     TimerSession,
+    TimerStopped,
     default_timer_service,
 )
 from momentum.models import TimerConfig
@@ -26,9 +29,13 @@ def _session_from_config(config: TimerConfig) -> TimerSession:
     )
 
 
-def run_timer(config: TimerConfig) -> bool:
-    """Run a countdown timer. Returns True if completed, False if interrupted."""
-    return default_timer_service().run(_session_from_config(config)).completed
+def run_timer(config: TimerConfig, stop_event: threading.Event | None = None) -> bool:
+    """Run a countdown timer. Returns True if completed, False if interrupted.
+
+    Setting *stop_event* from another thread interrupts the timer promptly.
+    """
+    service = default_timer_service(stop_event)
+    return service.run(_session_from_config(config)).completed
 
 
 def run_focus(minutes: int = 15, task_id: int | None = None) -> bool:
@@ -54,6 +61,7 @@ __all__ = [
     "TimerProgressPort",
     "TimerService",
     "TimerSession",
+    "TimerStopped",
     "default_timer_service",
     "run_break",
     "run_focus",
@@ -5,10 +5,12 @@ All figures use a dark theme consistent with the Momentum GUI palette.
 
 from __future__ import annotations
 
+import functools
 import importlib
 import io
 import math
 import os
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Optional, cast
 
@@ -118,21 +120,14 @@ def _domain_percentages(result: AssessmentResult) -> list[float]:
     return percentages
 
 
-def bdefs_radar(
-    latest: Optional[AssessmentResult] = None,
-    previous: Optional[AssessmentResult] = None,
-    *,
-    title: str = "Executive Function Profile",
-    size: tuple[int, int] = (540, 440),
-    dpi: int = 100,
-) -> PILImage:
-    latest_vals = _domain_values(latest) if latest else [0.0] * len(_DOMAIN_ORDER)
+@functools.lru_cache(maxsize=4)
+def _radar_axes(size: tuple[int, int], dpi: int) -> Any:
+    """Build the radar figure's static scaffolding once per ``(size, dpi)``.
 
+    Axis limits, tick labels and grid styling never change between calls, so
+    :func:`bdefs_radar` only swaps the data artists on the cached axes.
+    """
     n_axes = len(_DOMAIN_ORDER)
-    angles = np.linspace(0, 2 * math.pi, n_axes, endpoint=False).tolist()
-    angles += angles[:1]
-    latest_closed = latest_vals + latest_vals[:1]
-
     fig_w, fig_h = size[0] / dpi, size[1] / dpi
     fig = Figure(figsize=(fig_w, fig_h), dpi=dpi, facecolor=CHART_BG)
     ax = fig.add_subplot(111, polar=True)
@@ -143,7 +138,7 @@ def bdefs_radar(
     ax.set_yticklabels(
         [str(v) for v in range(0, _DOMAIN_MAX + 1, 3)], color=CHART_FG, fontsize=7
     )
-    ax.set_xticks(angles[:-1])
+    ax.set_xticks(np.linspace(0, 2 * math.pi, n_axes, endpoint=False).tolist())
     short_labels = [
         d.replace(" & ", "\n& ").replace("Organisation", "Org.") for d in _DOMAIN_ORDER
     ]
@@ -151,33 +146,61 @@ def bdefs_radar(
     ax.tick_params(axis="x", pad=12)
     ax.spines["polar"].set_color(CHART_GRID)
     ax.grid(color=CHART_GRID, linewidth=0.5)
+    return ax
+
+
+# The cached radar axes are shared, so renders must not interleave.
+_RADAR_LOCK = threading.Lock()
+
+
+def bdefs_radar(
+    latest: Optional[AssessmentResult] = None,
+    previous: Optional[AssessmentResult] = None,
+    *,
+    title: str = "Executive Function Profile",
+    size: tuple[int, int] = (540, 440),
+    dpi: int = 100,
+) -> PILImage:
+    latest_vals = _domain_values(latest) if latest else [0.0] * len(_DOMAIN_ORDER)
+
+    n_axes = len(_DOMAIN_ORDER)
+    angles = np.linspace(0, 2 * math.pi, n_axes, endpoint=False).tolist()
+    angles += angles[:1]
+    latest_closed = latest_vals + latest_vals[:1]
+
+    with _RADAR_LOCK:
+        ax = _radar_axes(size, dpi)
+        for artist in (*ax.lines, *ax.patches):
+            artist.remove()
+
+        if previous is not None:
+            prev_vals = _domain_values(previous) + _domain_values(previous)[:1]
+            ax.plot(
+                angles,
+                prev_vals,
+                color=CHART_GREY_LINE,
+                linewidth=1.2,
+                alpha=0.6,
+                label="Previous",
+            )
+            ax.fill(angles, prev_vals, color=CHART_GREY_FILL)
 
-    if previous is not None:
-        prev_vals = _domain_values(previous) + _domain_values(previous)[:1]
         ax.plot(
-            angles,
-            prev_vals,
-            color=CHART_GREY_LINE,
-            linewidth=1.2,
-            alpha=0.6,
-            label="Previous",
+            angles, latest_closed, color=CHART_BLUE_LINE, linewidth=2, label="Latest"
         )
-        ax.fill(angles, prev_vals, color=CHART_GREY_FILL)
+        ax.fill(angles, latest_closed, color=CHART_BLUE_FILL)
 
-    ax.plot(angles, latest_closed, color=CHART_BLUE_LINE, linewidth=2, label="Latest")
-    ax.fill(angles, latest_closed, color=CHART_BLUE_FILL)
-
-    ax.legend(
-        loc="upper right",
-        bbox_to_anchor=(1.3, 1.1),
-        fontsize=8,
-        facecolor=CHART_BG,
-        edgecolor=CHART_GRID,
-        labelcolor=CHART_FG,
-    )
-    ax.set_title(title, color=CHART_FG, fontsize=11, fontweight="bold", pad=18)
+        ax.legend(
+            loc="upper right",
+            bbox_to_anchor=(1.3, 1.1),
+            fontsize=8,
+            facecolor=CHART_BG,
+            edgecolor=CHART_GRID,
+            labelcolor=CHART_FG,
+        )
+        ax.set_title(title, color=CHART_FG, fontsize=11, fontweight="bold", pad=18)
 
-    return _fig_to_pil(fig, dpi=dpi)
+        return _fig_to_pil(ax.figure, dpi=dpi)
 
 
 def bdefs_timeseries(
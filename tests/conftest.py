@@ -0,0 +1,51 @@
+"""Shared pytest configuration."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+
+import pytest
+
+# Select the headless backend before anything imports matplotlib.
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+# Plain CLI output for substring assertions, even under FORCE_COLOR. Rich
+# picks its colour system when momentum.ui.display builds its Console at
+# import, so this must be set here rather than in a fixture.
+os.environ["NO_COLOR"] = "1"
+os.environ["TERM"] = "dumb"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolate_user_dirs(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Point momentum's config, data and cache dirs at one session temp root.
+
+    ``momentum.config`` resolves these from ``Path.home()`` once, at import,
+    so setting XDG variables here would have no effect. Redirecting the module
+    paths means a test that forgets its own per-test isolation still never
+    reads or writes the real user's files. Fixtures that need a fresh
+    directory per test keep patching on top of this.
+    """
+    root = tmp_path_factory.mktemp("home")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("momentum.config._CONFIG_DIR", root / "config")
+        mp.setattr("momentum.config._CONFIG_FILE", root / "config" / "config.json")
+        mp.setattr("momentum.config._DB_DIR", root / "data")
+        mp.setattr("momentum.config._CACHE_DIR", root / "cache")
+        yield
+
+
+@pytest.fixture(scope="session")
+def _warm_matplotlib_fonts() -> None:
+    """Load the font cache and resolve the default font once per session.
+
+    Matplotlib reads (or on first run, builds) its font list lazily; doing it
+    up front keeps that cost out of whichever chart test happens to run first.
+    The list itself is persisted under matplotlib's own cache directory.
+    Not autouse: only modules that render charts request it, so sessions
+    (or xdist workers) running just the CLI tests never import matplotlib.
+    """
+    from matplotlib import font_manager
+
+    font_manager.findfont(font_manager.FontProperties())
@@ -6,8 +6,10 @@ from momentum.assessments import (
     BDEFS_QUESTIONS,
     BDEFS_SCALE,
     BISBAS_QUESTIONS,
+    STROOP_COLOURS,
     StroopResult,
     StroopTrial,
+    bdefs_domain_max_score,
     bdefs_max_score,
     bisbas_effective_domain_max_score,
     bisbas_normalized_domain_score,
@@ -33,6 +35,12 @@ class TestBDEFS:
         n_items = sum(len(qs) for qs in BDEFS_QUESTIONS.values())
         assert bdefs_max_score() == n_items * 4
 
+    def test_domain_max_scores_sum_to_total(self) -> None:
+        for domain, qs in BDEFS_QUESTIONS.items():
+            assert bdefs_domain_max_score(domain) == len(qs) * 4
+        assert sum(map(bdefs_domain_max_score, BDEFS_QUESTIONS)) == bdefs_max_score()
+        assert bdefs_domain_max_score("Unknown") == 0
+
     def test_score_bdefs_minimal(self) -> None:
         answers = {d: [1] * len(qs) for d, qs in BDEFS_QUESTIONS.items()}
         result = score_bdefs(answers)
@@ -112,6 +120,12 @@ class TestStroop:
         for t in trials:
             assert t.word != t.ink_colour
 
+    def test_generate_trials_cover_every_pairing(self) -> None:
+        trials = generate_stroop_trials(500)
+        pairs = {(t.word, t.ink_colour) for t in trials}
+        n = len(STROOP_COLOURS)
+        assert len(pairs) == n * (n - 1)
+
     def test_stroop_result_accuracy(self) -> None:
         r = StroopResult(trials=10, correct=7, total_time_s=15.0)
         assert r.accuracy_pct == 70.0
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import subprocess
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, create_autospec, patch
 
+import pytest
+
+from momentum import autostart
 from momentum.autostart import (
     _desktop_entry_path,
     _service_path,
@@ -16,6 +21,40 @@ from momentum.autostart import (
 )
 
 
+@pytest.fixture
+def mock_run(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace ``subprocess.run`` as seen by the autostart module."""
+    run = create_autospec(subprocess.run)
+    # Callers only read .returncode, so a plain namespace stands in for the
+    # CompletedProcess instead of another auto-created MagicMock.
+    run.return_value = SimpleNamespace(returncode=0)
+    monkeypatch.setattr(autostart.subprocess, "run", run)
+    return run
+
+
+@pytest.fixture
+def autostart_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point autostart at a fake binary and unit directories under tmp_path.
+
+    The unit file paths are derived from the two directories, so patching
+    those is enough to keep writes out of the real home directory.
+    """
+    monkeypatch.setattr(autostart, "_find_momentum_bin", lambda: "/usr/bin/momentum")
+    monkeypatch.setattr(
+        autostart, "_systemd_dir", lambda: tmp_path / "systemd" / "user"
+    )
+    monkeypatch.setattr(autostart, "_xdg_autostart_dir", lambda: tmp_path / "autostart")
+    return tmp_path
+
+
+def _fake_path(path: str, *, exists: bool) -> MagicMock:
+    """Return an in-memory stand-in for an existing or missing unit file."""
+    fake = create_autospec(Path, instance=True)
+    fake.exists.return_value = exists
+    fake.__str__.return_value = path
+    return fake
+
+
 class TestPaths:
     def test_systemd_dir(self) -> None:
         d = _systemd_dir()
@@ -41,92 +80,62 @@ class TestEnableAutostart:
             assert not status.systemd_enabled
             assert not status.xdg_enabled
 
-    def test_enable_success(self, tmp_path: Path) -> None:
-        svc_dir = tmp_path / "systemd" / "user"
-        xdg_dir = tmp_path / "autostart"
-        with (
-            patch(
-                "momentum.autostart._find_momentum_bin",
-                return_value="/usr/bin/momentum",
-            ),
-            patch("momentum.autostart._systemd_dir", return_value=svc_dir),
-            patch("momentum.autostart._xdg_autostart_dir", return_value=xdg_dir),
-            patch(
-                "momentum.autostart._service_path",
-                return_value=svc_dir / "momentum-gui.service",
-            ),
-            patch(
-                "momentum.autostart._desktop_entry_path",
-                return_value=xdg_dir / "momentum-gui.desktop",
-            ),
-            patch("subprocess.run") as mock_run,
-        ):
-            status = enable_autostart()
-            assert status.systemd_enabled
-            assert status.xdg_enabled
-            assert status.service_path is not None
-            assert status.desktop_entry_path is not None
-            # Verify systemd commands were called
-            assert mock_run.call_count == 2  # daemon-reload + enable
-
-    def test_enable_systemd_failure(self, tmp_path: Path) -> None:
-        svc_dir = tmp_path / "systemd" / "user"
-        xdg_dir = tmp_path / "autostart"
-        with (
-            patch(
-                "momentum.autostart._find_momentum_bin",
-                return_value="/usr/bin/momentum",
-            ),
-            patch("momentum.autostart._systemd_dir", return_value=svc_dir),
-            patch("momentum.autostart._xdg_autostart_dir", return_value=xdg_dir),
-            patch(
-                "momentum.autostart._service_path",
-                return_value=svc_dir / "momentum-gui.service",
-            ),
-            patch(
-                "momentum.autostart._desktop_entry_path",
-                return_value=xdg_dir / "momentum-gui.desktop",
-            ),
-            patch("subprocess.run", side_effect=FileNotFoundError),
-        ):
-            status = enable_autostart()
-            assert not status.systemd_enabled
-            # XDG should still succeed
-            assert status.xdg_enabled
+    def test_enable_success(self, autostart_env: Path, mock_run: MagicMock) -> None:
+        status = enable_autostart()
+        assert status.systemd_enabled
+        assert status.xdg_enabled
+        assert status.service_path is not None
+        assert status.desktop_entry_path is not None
+        assert Path(status.service_path).is_relative_to(autostart_env)
+        # A single `enable` call; it reloads the manager implicitly.
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0] == [
+            "systemctl",
+            "--user",
+            "enable",
+            "momentum-gui.service",
+        ]
+
+    def test_enable_systemd_failure(
+        self, autostart_env: Path, mock_run: MagicMock
+    ) -> None:
+        mock_run.side_effect = FileNotFoundError
+        status = enable_autostart()
+        assert not status.systemd_enabled
+        # XDG should still succeed
+        assert status.xdg_enabled
 
 
 class TestDisableAutostart:
-    def test_disable_clean(self, tmp_path: Path) -> None:
-        svc = tmp_path / "momentum-gui.service"
-        entry = tmp_path / "momentum-gui.desktop"
-        svc.write_text("test")
-        entry.write_text("test")
+    def test_disable_clean(self, mock_run: MagicMock) -> None:
+        svc = _fake_path("/svc/momentum-gui.service", exists=True)
+        entry = _fake_path("/xdg/momentum-gui.desktop", exists=True)
         with (
             patch("momentum.autostart._service_path", return_value=svc),
             patch("momentum.autostart._desktop_entry_path", return_value=entry),
-            patch("subprocess.run"),
         ):
             disable_autostart()
-            assert not svc.exists()
-            assert not entry.exists()
+            svc.unlink.assert_called_once_with()
+            entry.unlink.assert_called_once_with()
 
-    def test_disable_no_files(self, tmp_path: Path) -> None:
+    def test_disable_no_files(self, tmp_path: Path, mock_run: MagicMock) -> None:
         svc = tmp_path / "momentum-gui.service"
         entry = tmp_path / "momentum-gui.desktop"
         with (
             patch("momentum.autostart._service_path", return_value=svc),
             patch("momentum.autostart._desktop_entry_path", return_value=entry),
-            patch("subprocess.run"),
         ):
             disable_autostart()  # should not raise
 
-    def test_disable_systemctl_missing(self, tmp_path: Path) -> None:
+    def test_disable_systemctl_missing(
+        self, tmp_path: Path, mock_run: MagicMock
+    ) -> None:
+        mock_run.side_effect = FileNotFoundError
         svc = tmp_path / "momentum-gui.service"
         entry = tmp_path / "momentum-gui.desktop"
         with (
             patch("momentum.autostart._service_path", return_value=svc),
             patch("momentum.autostart._desktop_entry_path", return_value=entry),
-            patch("subprocess.run", side_effect=FileNotFoundError),
         ):
             disable_autostart()  # should not raise
 
@@ -143,44 +152,38 @@ class TestGetAutostartStatus:
             assert not status.systemd_enabled
             assert not status.xdg_enabled
 
-    def test_service_enabled(self, tmp_path: Path) -> None:
-        svc = tmp_path / "momentum-gui.service"
-        svc.write_text("[Unit]\n")
-        entry = tmp_path / "momentum-gui.desktop"
-        entry.write_text("[Desktop Entry]\n")
-        mock_proc = MagicMock()
-        mock_proc.returncode = 0
+    def test_service_enabled(self, mock_run: MagicMock) -> None:
+        svc = _fake_path("/svc/momentum-gui.service", exists=True)
+        entry = _fake_path("/xdg/momentum-gui.desktop", exists=True)
         with (
             patch("momentum.autostart._service_path", return_value=svc),
             patch("momentum.autostart._desktop_entry_path", return_value=entry),
-            patch("subprocess.run", return_value=mock_proc),
         ):
             status = get_autostart_status()
             assert status.systemd_enabled
             assert status.xdg_enabled
-
-    def test_service_present_but_disabled(self, tmp_path: Path) -> None:
-        svc = tmp_path / "momentum-gui.service"
-        svc.write_text("[Unit]\n")
-        entry = tmp_path / "momentum-gui.desktop"
-        mock_proc = MagicMock()
-        mock_proc.returncode = 1  # not enabled
+            mock_run.assert_called_once()
+            assert status.service_path == "/svc/momentum-gui.service"
+            assert status.desktop_entry_path == "/xdg/momentum-gui.desktop"
+
+    def test_service_present_but_disabled(self, mock_run: MagicMock) -> None:
+        svc = _fake_path("/svc/momentum-gui.service", exists=True)
+        entry = _fake_path("/xdg/momentum-gui.desktop", exists=False)
+        mock_run.return_value = SimpleNamespace(returncode=1)  # not enabled
         with (
             patch("momentum.autostart._service_path", return_value=svc),
             patch("momentum.autostart._desktop_entry_path", return_value=entry),
-            patch("subprocess.run", return_value=mock_proc),
         ):
             status = get_autostart_status()
             assert not status.systemd_enabled
 
-    def test_systemctl_not_found(self, tmp_path: Path) -> None:
-        svc = tmp_path / "momentum-gui.service"
-        svc.write_text("[Unit]\n")
-        entry = tmp_path / "momentum-gui.desktop"
+    def test_systemctl_not_found(self, mock_run: MagicMock) -> None:
+        mock_run.side_effect = FileNotFoundError
+        svc = _fake_path("/svc/momentum-gui.service", exists=True)
+        entry = _fake_path("/xdg/momentum-gui.desktop", exists=False)
         with (
             patch("momentum.autostart._service_path", return_value=svc),
             patch("momentum.autostart._desktop_entry_path", return_value=entry),
-            patch("subprocess.run", side_effect=FileNotFoundError),
         ):
             status = get_autostart_status()
             assert not status.systemd_enabled
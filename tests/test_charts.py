@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import os
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
+import pytest
 from PIL import Image
 
 import momentum.ui.charts as charts
@@ -16,6 +18,31 @@ from momentum.charts import (
 )
 from momentum.models import AssessmentResult, AssessmentType
 
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.usefixtures("_warm_matplotlib_fonts"),
+]
+
+# Read-only score templates; AssessmentResult validation copies them into a
+# fresh dict, so every result still owns its domain_scores.
+_BDEFS_DOMAIN_SCORES = MappingProxyType(
+    {
+        "Time Management": 6,
+        "Organisation & Problem-Solving": 6,
+        "Self-Restraint": 6,
+        "Self-Motivation": 6,
+        "Emotion Regulation": 6,
+    }
+)
+_BISBAS_DOMAIN_SCORES = MappingProxyType(
+    {
+        "Behavioral Inhibition (BIS)": 8,
+        "BAS Drive": 11,
+        "BAS Reward Responsiveness": 12,
+        "BAS Fun Seeking": 9,
+    }
+)
+
 
 def _make_bdefs_result(
     score: int = 30,
@@ -27,13 +54,7 @@ def _make_bdefs_result(
         assessment_type=AssessmentType.BDEFS,
         score=score,
         max_score=60,
-        domain_scores={
-            "Time Management": 6,
-            "Organisation & Problem-Solving": 6,
-            "Self-Restraint": 6,
-            "Self-Motivation": 6,
-            "Emotion Regulation": 6,
-        },
+        domain_scores=_BDEFS_DOMAIN_SCORES,  # type: ignore[arg-type]
         taken_at=taken_at or datetime.now(),
     )
 
@@ -44,12 +65,7 @@ def _make_bisbas_result(score: int = 40) -> AssessmentResult:
         assessment_type=AssessmentType.BISBAS,
         score=score,
         max_score=80,
-        domain_scores={
-            "Behavioral Inhibition (BIS)": 8,
-            "BAS Drive": 11,
-            "BAS Reward Responsiveness": 12,
-            "BAS Fun Seeking": 9,
-        },
+        domain_scores=_BISBAS_DOMAIN_SCORES,  # type: ignore[arg-type]
         taken_at=datetime.now(),
     )
 
@@ -80,6 +96,17 @@ class TestBdefsRadar:
         img = bdefs_radar(latest=latest, previous=previous)
         assert isinstance(img, Image.Image)
 
+    def test_reuses_cached_figure_without_stale_artists(self) -> None:
+        latest = _make_bdefs_result(score=30)
+        previous = _make_bdefs_result(score=20)
+        first = bdefs_radar(latest=latest)
+        bdefs_radar(latest=latest, previous=previous)
+        again = bdefs_radar(latest=latest)
+        assert first.tobytes() == again.tobytes()
+        ax = charts._radar_axes((540, 440), 100)
+        assert len(ax.lines) == 1
+        assert len(ax.patches) == 1
+
 
 class TestBdefsTimeseries:
     def test_returns_none_for_fewer_than_two(self) -> None:
@@ -2,63 +2,191 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
+import sqlite3
+import uuid
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from click.testing import CliRunner as ClickCliRunner
+from click.testing import Result
+from typer.main import get_command
 from typer.testing import CliRunner
 
+from momentum import db
+from momentum.assessments import StroopResult, score_bdefs, score_stroop
 from momentum.cli import app
+from momentum.models import AppConfig, AutostartStatus, TaskStatus
 
-runner = CliRunner()
+_click_command = functools.lru_cache(maxsize=None)(get_command)
+
+
+class _CachedCliRunner(CliRunner):
+    """CliRunner that converts each Typer app to a Click command only once.
+
+    Typer's runner rebuilds the whole Click command tree on every invoke;
+    the tree is immutable, so the suite shares one per app.
+
+    Unexpected exceptions propagate (``catch_exceptions=False``) so a broken
+    command fails with its own traceback; ``typer.Exit`` and other
+    ``SystemExit`` codes are still reported through ``result.exit_code``.
+    """
+
+    def invoke(self, app, args=None, **kwargs) -> Result:  # type: ignore[override]
+        kwargs.setdefault("catch_exceptions", False)
+        return ClickCliRunner.invoke(self, _click_command(app), args, **kwargs)
+
+
+runner = _CachedCliRunner()
+
+# The CLI only reads these, so one instance of each serves every test.
+_AUTOSTART_ON = AutostartStatus(systemd_enabled=True, xdg_enabled=True)
+_AUTOSTART_OFF = AutostartStatus()
+
+# 8 correct 1 s answers followed by 2 wrong 2 s answers.
+_STROOP_PER_TRIAL: tuple[tuple[bool, float], ...] = tuple(
+    itertools.chain(itertools.repeat((True, 1.0), 8), itertools.repeat((False, 2.0), 2))
+)
+
+
+@pytest.fixture(scope="session")
+def _schema_template():
+    """An in-memory database with the schema applied, built once per run."""
+    conn = db.get_connection(":memory:")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def memory_db(_schema_template, monkeypatch: pytest.MonkeyPatch):
+    """Redirect a CLI test to a private in-memory database.
+
+    A shared-cache memory database lives as long as one connection is open,
+    so an idle keep-alive connection carries state across CLI invocations.
+    It starts as a copy of the schema template, so the tables are never
+    created from scratch per test.
+    """
+    uri = f"file:momentum-{uuid.uuid4().hex}?mode=memory&cache=shared"
+    keepalive = sqlite3.connect(uri, uri=True)
+    _schema_template.backup(keepalive)
+    monkeypatch.setattr("momentum.db._get_db_path", lambda: uri)
+    yield
+    keepalive.close()
 
 
 @pytest.fixture(autouse=True)
-def _use_tmp_db(tmp_path: Path):
-    """Redirect all CLI tests to a temporary database."""
-    db_path = tmp_path / "test.db"
-    with patch("momentum.db._get_db_path", return_value=db_path):
-        yield
+def _isolate_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep every CLI test away from the real (and shared) config and data.
+
+    Tests that use the database request :func:`memory_db`; redirecting the
+    default database directory as well means one that forgets to can never
+    write to the user's real database.
+    """
+    cfg_dir = tmp_path / "config"
+    monkeypatch.setattr("momentum.config._CONFIG_DIR", cfg_dir)
+    monkeypatch.setattr("momentum.config._CONFIG_FILE", cfg_dir / "config.json")
+    monkeypatch.setattr("momentum.config._DB_DIR", tmp_path / "data")
+
+
+@pytest.fixture
+def db_conn(memory_db):
+    """Open the test database directly, to seed state without the CLI."""
+    conn = db.get_connection()
+    yield conn
+    conn.close()
+
+
+def _seed_tasks(
+    conn: sqlite3.Connection, *titles: str, parent_id: int | None = None
+) -> None:
+    """Insert tasks straight into the database, bypassing the CLI.
+
+    Rows match what :func:`momentum.db.add_task` writes, but go in as one
+    ``executemany`` batch and a single commit.
+    """
+    now = datetime.now().isoformat()
+    with conn:
+        conn.executemany(
+            "INSERT INTO tasks (title, parent_id, status, created_at) VALUES (?, ?, ?, ?)",
+            [(title, parent_id, TaskStatus.PENDING.value, now) for title in titles],
+        )
 
 
+def _seed_bdefs(conn: sqlite3.Connection) -> None:
+    """Store one scored BDEFS result directly in the database."""
+    answers = {
+        "Time Management": [2, 2, 2],
+        "Organisation & Problem-Solving": [2, 2, 2],
+        "Self-Restraint": [1, 1, 1],
+        "Self-Motivation": [3, 3, 3],
+        "Emotion Regulation": [2, 2, 2],
+    }
+    db.save_assessment(conn, score_bdefs(answers))
+
+
+def _seed_stroop(conn: sqlite3.Connection) -> None:
+    """Store one scored Stroop result (8/10 correct) directly in the database."""
+    result = StroopResult(
+        trials=10,
+        correct=8,
+        total_time_s=12.0,
+        per_trial=list(_STROOP_PER_TRIAL),
+    )
+    db.save_assessment(conn, score_stroop(result))
+
+
+@pytest.mark.usefixtures("memory_db")
 class TestAdd:
     def test_add_task(self) -> None:
         result = runner.invoke(app, ["add", "Write introduction"])
         assert result.exit_code == 0
         assert "Added task #1" in result.output
 
-    def test_add_multiple(self) -> None:
-        runner.invoke(app, ["add", "Task one"])
+    def test_add_multiple(self, db_conn) -> None:
+        _seed_tasks(db_conn, "Task one")
         result = runner.invoke(app, ["add", "Task two"])
         assert "Added task #2" in result.output
 
 
+@pytest.mark.usefixtures("memory_db")
 class TestDone:
-    def test_complete_existing(self) -> None:
-        runner.invoke(app, ["add", "Finish"])
-        result = runner.invoke(app, ["done", "1"])
-        assert result.exit_code == 0
-        assert "Completed" in result.output
-
-    def test_complete_nonexistent(self) -> None:
-        result = runner.invoke(app, ["done", "999"])
-        assert result.exit_code == 1
-
-
+    @pytest.mark.parametrize(
+        ("seeded", "task_id", "exit_code", "expected"),
+        [
+            (("Finish",), "1", 0, "Completed"),
+            ((), "999", 1, "not found"),
+        ],
+        ids=["existing", "nonexistent"],
+    )
+    def test_complete(self, db_conn, seeded, task_id, exit_code, expected) -> None:
+        _seed_tasks(db_conn, *seeded)
+        result = runner.invoke(app, ["done", task_id])
+        assert result.exit_code == exit_code
+        assert expected in result.output
+
+
+@pytest.mark.usefixtures("memory_db")
 class TestList:
-    def test_list_empty(self) -> None:
+    @pytest.mark.parametrize(
+        ("seeded", "expected"),
+        [
+            ((), ("No tasks",)),
+            (("Alpha", "Beta"), ("Alpha", "Beta")),
+        ],
+        ids=["empty", "with-tasks"],
+    )
+    def test_list(self, db_conn, seeded, expected) -> None:
+        _seed_tasks(db_conn, *seeded)
         result = runner.invoke(app, ["list"])
         assert result.exit_code == 0
-        assert "No tasks" in result.output
-
-    def test_list_with_tasks(self) -> None:
-        runner.invoke(app, ["add", "Alpha"])
-        runner.invoke(app, ["add", "Beta"])
-        result = runner.invoke(app, ["list"])
-        assert "Alpha" in result.output
-        assert "Beta" in result.output
+        for text in expected:
+            assert text in result.output
 
 
+@pytest.mark.usefixtures("memory_db")
 class TestStatus:
     def test_status_empty(self) -> None:
         result = runner.invoke(app, ["status"])
@@ -66,24 +194,28 @@ class TestStatus:
         assert "Status" in result.output
 
 
+@pytest.mark.usefixtures("memory_db")
 class TestNudge:
     def test_nudge(self) -> None:
         result = runner.invoke(app, ["nudge"])
         assert result.exit_code == 0
         # Should print some non-empty message
-        assert len(result.output.strip()) > 0
+        assert result.stdout_bytes.strip()
 
 
 class TestConfig:
-    def test_show_default(self) -> None:
-        result = runner.invoke(app, ["config", "--show"])
-        assert result.exit_code == 0
-        assert "Database" in result.output
-
-    def test_no_flags(self) -> None:
-        result = runner.invoke(app, ["config"])
-        assert result.exit_code == 0
-        assert "--sync" in result.output or "--db-path" in result.output
+    @pytest.mark.parametrize(
+        ("args", "expected"),
+        [
+            (["config", "--show"], "Database"),
+            (["config"], "--db-path"),
+        ],
+        ids=["show-default", "no-flags"],
+    )
+    def test_informational(self, args, expected) -> None:
+        result = runner.invoke(app, args)
+        assert result.exit_code == 0
+        assert expected in result.output
 
     def test_set_db_path(self, tmp_path: Path) -> None:
         db = tmp_path / "custom.db"
@@ -101,6 +233,7 @@ class TestConfig:
         assert result.exit_code == 1
 
 
+@pytest.mark.usefixtures("memory_db")
 class TestTestResults:
     def test_no_results(self) -> None:
         result = runner.invoke(app, ["test-results"])
@@ -115,11 +248,7 @@ class TestTestResults:
 class TestAutostart:
     @patch("momentum.autostart.enable_autostart")
     def test_enable(self, mock_enable) -> None:
-        from momentum.models import AutostartStatus
-
-        mock_enable.return_value = AutostartStatus(
-            systemd_enabled=True, xdg_enabled=True
-        )
+        mock_enable.return_value = _AUTOSTART_ON
         result = runner.invoke(app, ["autostart", "--enable"])
         assert result.exit_code == 0
         assert "enabled" in result.output.lower()
@@ -132,9 +261,7 @@ class TestAutostart:
 
     @patch("momentum.autostart.get_autostart_status")
     def test_status(self, mock_status) -> None:
-        from momentum.models import AutostartStatus
-
-        mock_status.return_value = AutostartStatus()
+        mock_status.return_value = _AUTOSTART_OFF
         result = runner.invoke(app, ["autostart", "--status"])
         assert result.exit_code == 0
 
@@ -144,42 +271,45 @@ class TestAutostart:
         assert "--enable" in result.output or "Use" in result.output
 
 
+@pytest.mark.usefixtures("memory_db")
 class TestBreakDown:
     def test_nonexistent_task(self) -> None:
         result = runner.invoke(app, ["break-down", "999"])
         assert result.exit_code == 1
         assert "not found" in result.output
 
-    def test_no_substeps_added(self) -> None:
-        runner.invoke(app, ["add", "Parent task"])
+    def test_no_substeps_added(self, db_conn) -> None:
+        _seed_tasks(db_conn, "Parent task")
         result = runner.invoke(app, ["break-down", "1"], input="\n")
         assert result.exit_code == 0
         assert "No sub-steps" in result.output
 
-    def test_add_substeps(self) -> None:
-        runner.invoke(app, ["add", "Big task"])
+    def test_add_substeps(self, db_conn) -> None:
+        _seed_tasks(db_conn, "Big task")
         result = runner.invoke(app, ["break-down", "1"], input="Step A\nStep B\n\n")
         assert result.exit_code == 0
         assert "2 sub-steps" in result.output
 
 
+@pytest.mark.usefixtures("memory_db")
 class TestListAll:
-    def test_list_all_includes_done(self) -> None:
-        runner.invoke(app, ["add", "Task one"])
-        runner.invoke(app, ["done", "1"])
+    def test_list_all_includes_done(self, db_conn) -> None:
+        _seed_tasks(db_conn, "Task one")
+        db.complete_task(db_conn, 1)
         result = runner.invoke(app, ["list", "--all"])
         assert result.exit_code == 0
         assert "Task one" in result.output
 
-    def test_list_with_subtasks(self) -> None:
-        runner.invoke(app, ["add", "Parent"])
-        runner.invoke(app, ["break-down", "1"], input="Child A\nChild B\n\n")
+    def test_list_with_subtasks(self, db_conn) -> None:
+        _seed_tasks(db_conn, "Parent")
+        _seed_tasks(db_conn, "Child A", "Child B", parent_id=1)
         result = runner.invoke(app, ["list"])
         assert result.exit_code == 0
         assert "Parent" in result.output
         assert "Child A" in result.output
 
 
+@pytest.mark.usefixtures("memory_db")
 class TestFocus:
     @patch("momentum.cli._timer_service")
     def test_focus_no_task(self, mock_service) -> None:
@@ -189,9 +319,9 @@ class TestFocus:
         assert "Starting" in result.output
 
     @patch("momentum.cli._timer_service")
-    def test_focus_with_task(self, mock_service) -> None:
+    def test_focus_with_task(self, mock_service, db_conn) -> None:
         mock_service.return_value.run_focus.return_value.completed = False
-        runner.invoke(app, ["add", "Focus target"])
+        _seed_tasks(db_conn, "Focus target")
         result = runner.invoke(app, ["focus", "--task", "1"])
         assert result.exit_code == 0
         assert "Focusing on" in result.output
@@ -219,6 +349,7 @@ class TestFocus:
         service.run_break.assert_not_called()
 
 
+@pytest.mark.usefixtures("memory_db")
 class TestTakeBreak:
     @patch("momentum.cli._timer_service")
     def test_take_break(self, mock_service) -> None:
@@ -238,8 +369,6 @@ class TestTakeBreak:
 class TestConfigExtra:
     @patch("momentum.config.set_cloud_sync")
     def test_sync_success(self, mock_sync) -> None:
-        from momentum.models import AppConfig
-
         mock_sync.return_value = AppConfig(db_path="/tmp/synced.db")
         result = runner.invoke(app, ["config", "--sync", "onedrive"])
         assert result.exit_code == 0
@@ -254,70 +383,39 @@ class TestConfigExtra:
 
 
 class TestTestResultsWithData:
-    def _save_bdefs(self) -> None:
-        from momentum import db as _db
-        from momentum.assessments import score_bdefs
-
-        conn = _db.get_connection()
-        answers = {
-            "Time Management": [2, 2, 2],
-            "Organisation & Problem-Solving": [2, 2, 2],
-            "Self-Restraint": [1, 1, 1],
-            "Self-Motivation": [3, 3, 3],
-            "Emotion Regulation": [2, 2, 2],
-        }
-        create = score_bdefs(answers)
-        _db.save_assessment(conn, create)
-        conn.close()
-
-    def _save_stroop(self) -> None:
-        from momentum import db as _db
-        from momentum.assessments import StroopResult, score_stroop
-
-        conn = _db.get_connection()
-        result = StroopResult(
-            trials=10,
-            correct=8,
-            total_time_s=12.0,
-            per_trial=[(True, 1.0)] * 8 + [(False, 2.0)] * 2,
-        )
-        create = score_stroop(result)
-        _db.save_assessment(conn, create)
-        conn.close()
-
-    def test_results_with_bdefs(self) -> None:
-        self._save_bdefs()
+    def test_results_with_bdefs(self, db_conn) -> None:
+        _seed_bdefs(db_conn)
         result = runner.invoke(app, ["test-results"])
         assert result.exit_code == 0
         assert "BDEFS" in result.output
         assert "Score" in result.output
         assert "Time Management" in result.output
 
-    def test_results_with_stroop(self) -> None:
-        self._save_stroop()
+    def test_results_with_stroop(self, db_conn) -> None:
+        _seed_stroop(db_conn)
         result = runner.invoke(app, ["test-results"])
         assert result.exit_code == 0
         assert "STROOP" in result.output
         assert "Avg response" in result.output
 
-    def test_results_filter_bdefs(self) -> None:
-        self._save_bdefs()
-        self._save_stroop()
+    def test_results_filter_bdefs(self, db_conn) -> None:
+        _seed_bdefs(db_conn)
+        _seed_stroop(db_conn)
         result = runner.invoke(app, ["test-results", "--type", "bdefs"])
         assert result.exit_code == 0
         assert "BDEFS" in result.output
         assert "STROOP" not in result.output
 
-    def test_results_filter_stroop(self) -> None:
-        self._save_bdefs()
-        self._save_stroop()
+    def test_results_filter_stroop(self, db_conn) -> None:
+        _seed_bdefs(db_conn)
+        _seed_stroop(db_conn)
         result = runner.invoke(app, ["test-results", "--type", "stroop"])
         assert result.exit_code == 0
         assert "STROOP" in result.output
 
-    def test_results_with_limit(self) -> None:
-        self._save_bdefs()
-        self._save_bdefs()
+    def test_results_with_limit(self, db_conn) -> None:
+        _seed_bdefs(db_conn)
+        _seed_bdefs(db_conn)
         result = runner.invoke(app, ["test-results", "--limit", "1"])
         assert result.exit_code == 0
         assert "BDEFS" in result.output
@@ -326,19 +424,13 @@ class TestTestResultsWithData:
 class TestAutostartExtra:
     @patch("momentum.autostart.enable_autostart")
     def test_enable_fails(self, mock_enable) -> None:
-        from momentum.models import AutostartStatus
-
-        mock_enable.return_value = AutostartStatus(
-            systemd_enabled=False, xdg_enabled=False
-        )
+        mock_enable.return_value = _AUTOSTART_OFF
         result = runner.invoke(app, ["autostart", "--enable"])
         assert result.exit_code == 0
         assert "could not" in result.output.lower()
 
     @patch("momentum.autostart.get_autostart_status")
     def test_status_with_paths(self, mock_status) -> None:
-        from momentum.models import AutostartStatus
-
         mock_status.return_value = AutostartStatus(
             systemd_enabled=True,
             xdg_enabled=True,
@@ -352,20 +444,20 @@ class TestAutostartExtra:
         assert "momentum.desktop" in result.output
 
 
+@pytest.mark.usefixtures("memory_db")
 class TestStart:
     @patch("momentum.cli._timer_service")
-    def test_start_with_active_task_continue(self, mock_service) -> None:
+    def test_start_with_active_task_continue(self, mock_service, db_conn) -> None:
         mock_service.return_value.run_focus.return_value.completed = False
-        runner.invoke(app, ["add", "Active thing"])
-        # Manually set task active via focus
-        runner.invoke(app, ["focus", "--task", "1"])
+        _seed_tasks(db_conn, "Active thing")
+        db.set_task_active(db_conn, 1)
         result = runner.invoke(app, ["start"], input="y\n")
         assert result.exit_code == 0
 
     @patch("momentum.cli._timer_service")
-    def test_start_with_pending_task_decline(self, mock_service) -> None:
+    def test_start_with_pending_task_decline(self, mock_service, db_conn) -> None:
         mock_service.return_value.run_focus.return_value.completed = False
-        runner.invoke(app, ["add", "Pending thing"])
+        _seed_tasks(db_conn, "Pending thing")
         result = runner.invoke(app, ["start"], input="n\n")
         assert result.exit_code == 0
 
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import date
+import sqlite3
+from datetime import date, timedelta
 from pathlib import Path
 
 import pytest
@@ -17,15 +18,75 @@ from momentum.models import (
 )
 
 
-@pytest.fixture()
-def conn(tmp_path: Path):
-    """Provide a fresh in-memory-like database for each test."""
-    db_path = tmp_path / "test.db"
-    connection = db.get_connection(db_path=db_path)
+@pytest.fixture(scope="module")
+def _module_conn():
+    """Open one in-memory database, with the schema applied, per module."""
+    connection = db.get_connection(":memory:")
     yield connection
     connection.close()
 
 
+@pytest.fixture()
+def conn(_module_conn: sqlite3.Connection):
+    """Provide an empty database for each test.
+
+    The db layer commits after every write, so a wrapping transaction or
+    savepoint cannot be rolled back; instead every table is emptied after the
+    test. Clearing ``sqlite_sequence`` restarts AUTOINCREMENT ids at 1.
+    """
+    yield _module_conn
+    _module_conn.rollback()
+    tables = _module_conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table'"
+    ).fetchall()
+    with _module_conn:
+        for (table,) in tables:
+            _module_conn.execute(f"DELETE FROM {table}")
+
+
+class TestConnection:
+    def test_data_dir_database_uses_wal(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("momentum.config._DB_DIR", tmp_path)
+        connection = db.get_connection(tmp_path / "test.db")
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert connection.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        connection.close()
+
+    def test_synced_database_keeps_rollback_journal(self, tmp_path: Path) -> None:
+        path = tmp_path / "OneDrive" / "momentum.db"
+        path.parent.mkdir()
+        connection = db.get_connection(path)
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        db.add_task(connection, TaskCreate(title="synced"))
+        assert not path.with_name("momentum.db-wal").exists()
+        connection.close()
+
+    def test_synced_database_leaves_wal_mode(self, tmp_path: Path) -> None:
+        path = tmp_path / "momentum.db"
+        legacy = sqlite3.connect(path)
+        legacy.execute("PRAGMA journal_mode = WAL")
+        legacy.close()
+        connection = db.get_connection(path)
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        connection.close()
+
+    def test_memory_database_still_opens(self) -> None:
+        connection = db.get_connection(":memory:")
+        assert connection.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        connection.close()
+
+    def test_shared_memory_uri_persists_across_connections(self) -> None:
+        uri = "file:test_db_shared?mode=memory&cache=shared"
+        first = db.get_connection(uri)
+        db.add_task(first, TaskCreate(title="Kept"))
+        second = db.get_connection(uri)
+        assert [t.title for t in db.list_tasks(second)] == ["Kept"]
+        second.close()
+        first.close()
+
+
 class TestTasks:
     def test_add_and_get(self, conn) -> None:
         task_in = TaskCreate(title="Write tests")
@@ -52,6 +113,19 @@ class TestTasks:
         assert len(active) == 1
         assert active[0].title == "Task B"
 
+    def test_list_all_tasks_orders_by_status(self, conn) -> None:
+        done = db.add_task(conn, TaskCreate(title="Done"))
+        pending = db.add_task(conn, TaskCreate(title="Pending"))
+        active = db.add_task(conn, TaskCreate(title="Active"))
+        db.complete_task(conn, done.id)
+        db.set_task_active(conn, active.id)
+
+        ordered = db.list_all_tasks(conn)
+        assert [t.id for t in ordered] == [active.id, pending.id, done.id]
+
+        open_only = db.list_all_tasks(conn, include_done=False)
+        assert [t.id for t in open_only] == [active.id, pending.id]
+
     def test_complete_task(self, conn) -> None:
         task = db.add_task(conn, TaskCreate(title="Finish"))
         completed = db.complete_task(conn, task.id)
@@ -104,6 +178,20 @@ class TestStatus:
         assert summary.today.focus_minutes == 15
         assert summary.streak_days == 1
 
+    def test_streak_counts_back_from_yesterday(self, conn) -> None:
+        today = date.today()
+        for offset, done in ((1, 2), (2, 1), (3, 0), (4, 3)):
+            conn.execute(
+                "INSERT INTO daily_log (date, tasks_completed, focus_minutes) "
+                "VALUES (?, ?, 0)",
+                ((today - timedelta(days=offset)).isoformat(), done),
+            )
+        conn.commit()
+
+        summary = db.get_status(conn)
+        assert summary.today.tasks_completed == 0
+        assert summary.streak_days == 2
+
     def test_daily_log_default(self, conn) -> None:
         log = db.get_daily_log(conn, date(2020, 1, 1))
         assert log.tasks_completed == 0
@@ -111,6 +199,16 @@ class TestStatus:
 
 
 class TestAssessments:
+    @pytest.fixture(scope="class")
+    def bdefs_batch(self) -> tuple[AssessmentResultCreate, ...]:
+        """Five BDEFS inputs (scores 20-24), validated once for the class."""
+        return tuple(
+            AssessmentResultCreate(
+                assessment_type=AssessmentType.BDEFS, score=20 + i, max_score=60
+            )
+            for i in range(5)
+        )
+
     def test_save_and_retrieve_bdefs(self, conn) -> None:
         create = AssessmentResultCreate(
             assessment_type=AssessmentType.BDEFS,
@@ -134,16 +232,9 @@ class TestAssessments:
         saved = db.save_assessment(conn, create)
         assert saved.assessment_type == AssessmentType.STROOP
 
-    def test_list_assessments_all(self, conn) -> None:
-        for i in range(3):
-            db.save_assessment(
-                conn,
-                AssessmentResultCreate(
-                    assessment_type=AssessmentType.BDEFS,
-                    score=20 + i,
-                    max_score=60,
-                ),
-            )
+    def test_list_assessments_all(self, conn, bdefs_batch) -> None:
+        for create in bdefs_batch[:3]:
+            db.save_assessment(conn, create)
         results = db.list_assessments(conn)
         assert len(results) == 3
         # Most recent first
@@ -166,15 +257,8 @@ class TestAssessments:
         assert len(bdefs) == 1
         assert bdefs[0].assessment_type == AssessmentType.BDEFS
 
-    def test_list_assessments_limit(self, conn) -> None:
-        for i in range(5):
-            db.save_assessment(
-                conn,
-                AssessmentResultCreate(
-                    assessment_type=AssessmentType.BDEFS,
-                    score=20 + i,
-                    max_score=60,
-                ),
-            )
+    def test_list_assessments_limit(self, conn, bdefs_batch) -> None:
+        for create in bdefs_batch:
+            db.save_assessment(conn, create)
         results = db.list_assessments(conn, limit=2)
         assert len(results) == 2
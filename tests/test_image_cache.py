@@ -0,0 +1,90 @@
+"""Tests for the on-disk banner image cache."""
+
+from __future__ import annotations
+
+import io
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from PIL import Image, JpegImagePlugin
+
+from momentum import _image_cache
+
+
+def _jpeg_bytes(w: int = 20, h: int = 10) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (w, h), (10, 20, 30)).save(buf, "JPEG")
+    return buf.getvalue()
+
+
+class TestGetBanner:
+    def test_miss_downloads_and_stores_png(self, tmp_path: Path) -> None:
+        with (
+            patch("momentum.config._CACHE_DIR", tmp_path),
+            patch(
+                "momentum._image_cache._download", return_value=_jpeg_bytes()
+            ) as mock_dl,
+        ):
+            data = _image_cache.get_banner("photo-abc", 20, 10)
+        assert mock_dl.call_count == 1
+        assert (tmp_path / "photo-abc_20x10.png").read_bytes() == data
+        assert Image.open(io.BytesIO(data)).size == (20, 10)
+
+    def test_hit_skips_network(self, tmp_path: Path) -> None:
+        with (
+            patch("momentum.config._CACHE_DIR", tmp_path),
+            patch(
+                "momentum._image_cache._download", return_value=_jpeg_bytes()
+            ) as mock_dl,
+        ):
+            first = _image_cache.get_banner("photo-abc", 20, 10)
+            second = _image_cache.get_banner("photo-abc", 20, 10)
+        assert mock_dl.call_count == 1
+        assert first == second
+
+    def test_shrinks_oversize_reply_into_box(self, tmp_path: Path) -> None:
+        with (
+            patch("momentum.config._CACHE_DIR", tmp_path),
+            patch("momentum._image_cache._download", return_value=_jpeg_bytes(80, 20)),
+        ):
+            data = _image_cache.get_banner("photo-abc", 20, 10)
+        assert Image.open(io.BytesIO(data)).size == (20, 5)
+
+    def test_large_jpeg_is_drafted_down(self, tmp_path: Path) -> None:
+        with (
+            patch("momentum.config._CACHE_DIR", tmp_path),
+            patch("momentum._image_cache._download", return_value=_jpeg_bytes(160, 80)),
+            patch.object(
+                JpegImagePlugin.JpegImageFile,
+                "draft",
+                autospec=True,
+                side_effect=JpegImagePlugin.JpegImageFile.draft,
+            ) as mock_draft,
+        ):
+            data = _image_cache.get_banner("photo-abc", 20, 10)
+        mock_draft.assert_called_once()
+        assert mock_draft.call_args.args[1:] == ("RGB", (20, 10))
+        assert Image.open(io.BytesIO(data)).size == (20, 10)
+
+
+class TestCachedPhotoIds:
+    def test_lists_only_matching_size(self, tmp_path: Path) -> None:
+        for name in ("photo-a_20x10.png", "photo-b_20x10.png", "photo-c_40x10.png"):
+            (tmp_path / name).write_bytes(b"x")
+        (tmp_path / "icon_v2.png").write_bytes(b"x")
+        with patch("momentum.config._CACHE_DIR", tmp_path):
+            ids = _image_cache.cached_photo_ids(20, 10)
+        assert sorted(ids) == ["photo-a", "photo-b"]
+
+
+class TestEvict:
+    def test_keeps_newest_entries(self, tmp_path: Path) -> None:
+        for i in range(5):
+            p = tmp_path / f"photo-{i}_1x1.png"
+            p.write_bytes(b"x")
+            os.utime(p, (i, i))
+        (tmp_path / "icon_v1.png").write_bytes(b"x")
+        _image_cache._evict(tmp_path, keep=2)
+        remaining = sorted(p.name for p in tmp_path.iterdir())
+        assert remaining == ["icon_v1.png", "photo-3_1x1.png", "photo-4_1x1.png"]
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from unittest.mock import patch
 
+import pytest
+
 from momentum.models import TimerConfig
 from momentum.timer import (
     SessionKind,
+    SystemClock,
     TimerOutcome,
     TimerService,
     TimerSession,
+    TimerStopped,
     run_break,
     run_focus,
     run_timer,
@@ -18,14 +23,17 @@ from momentum.timer import (
 
 
 class RecordingProgress:
+    """Records lifecycle events; per-second ticks are only tallied."""
+
     def __init__(self) -> None:
         self.events: list[tuple[object, ...]] = []
+        self.advanced = 0
 
     def start(self, *, label: str, total_seconds: int) -> None:
         self.events.append(("start", label, total_seconds))
 
     def advance(self, seconds: int = 1) -> None:
-        self.events.append(("advance", seconds))
+        self.advanced += seconds
 
     def interrupted(self, *, elapsed_seconds: int, total_seconds: int) -> None:
         self.events.append(("interrupted", elapsed_seconds, total_seconds))
@@ -92,7 +100,7 @@ class TestTimerService:
         assert clock.calls == 60
         assert progress.events[0] == ("start", "Focus (task #42)", 60)
         assert progress.events[-1] == ("complete",)
-        assert progress.events.count(("advance", 1)) == 60
+        assert progress.advanced == 60
         assert encouragement.delivered == ["Keep going"]
 
     def test_interrupt_returns_incomplete_outcome(self) -> None:
@@ -115,9 +123,43 @@ class TestTimerService:
         )
         assert progress.events[0] == ("start", "Break", 60)
         assert progress.events[-1] == ("interrupted", 3, 60)
+        assert progress.advanced == 3
         assert encouragement.delivered == []
 
 
+class TestSystemClock:
+    def test_ticks_follow_monotonic_schedule(self) -> None:
+        # Each tick finds 0.25s already spent on rendering since the last one.
+        now = iter([100.0, 101.25, 102.25])
+        with (
+            patch("momentum.domain.timer.time.monotonic", side_effect=now),
+            patch("momentum.domain.timer.time.sleep") as mock_sleep,
+        ):
+            clock = SystemClock()
+            for _ in range(3):
+                clock.sleep_one_second()
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 0.75, 0.75]
+
+    def test_restarts_schedule_after_stall(self) -> None:
+        now = iter([100.0, 110.0])
+        with (
+            patch("momentum.domain.timer.time.monotonic", side_effect=now),
+            patch("momentum.domain.timer.time.sleep") as mock_sleep,
+        ):
+            clock = SystemClock()
+            clock.sleep_one_second()
+            clock.sleep_one_second()
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 1.0]
+
+    def test_set_stop_event_raises_without_sleeping(self) -> None:
+        stop = threading.Event()
+        stop.set()
+        with patch("momentum.domain.timer.time.sleep") as mock_sleep:
+            with pytest.raises(TimerStopped):
+                SystemClock(stop).sleep_one_second()
+        mock_sleep.assert_not_called()
+
+
 class TestCompatibilityWrappers:
     @patch("momentum.timer.default_timer_service")
     def test_run_timer_uses_default_service(self, mock_factory) -> None:
@@ -133,6 +175,19 @@ class TestCompatibilityWrappers:
         assert run_timer(config) is True
         service.run.assert_called_once()
 
+    def test_run_timer_stops_on_event(self) -> None:
+        stop = threading.Event()
+        stop.set()
+        progress = RecordingProgress()
+        service = TimerService(
+            clock=SystemClock(stop),
+            progress=progress,
+            encouragement=RecordingEncouragement(),
+        )
+        with patch("momentum.timer.default_timer_service", return_value=service):
+            assert run_timer(TimerConfig(minutes=1, label="Test"), stop) is False
+        assert progress.events[-1] == ("interrupted", 0, 60)
+
     @patch("momentum.timer.default_timer_service")
     def test_run_focus(self, mock_factory) -> None:
         service = mock_factory.return_value